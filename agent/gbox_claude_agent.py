@@ -6,38 +6,446 @@ through the GBOX MCP server.
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
+import dataclasses
+import json
 import logging
 import os
+import re
+import reprlib
 import textwrap
 import threading
+import time
 from typing import Any, List, Optional
 
 from browser_env import Action, ActionTypes, Trajectory, create_stop_action
-from browser_env.utils import StateInfo
 
 logger = logging.getLogger(__name__)
 
+# Claude Code SDK (imported lazily on first agent construction, since it pulls
+# in a heavy dependency chain that tooling importing this module doesn't need)
+AgentDefinition = None
+ClaudeAgentOptions = None
+ClaudeSDKClient = None
+TextBlock = None
+ThinkingBlock = None
+ToolUseBlock = None
+ToolResultBlock = None
+ResultMessage = None
+create_wikipedia_subagent = None
+create_magento_admin_subagent = None
+_SDK_IMPORTED = False
+_IMPORT_ERROR: Optional[ImportError] = None
+
+# Content block class -> kind, filled in once the SDK is imported
+_BLOCK_KINDS: dict[type, str] = {}
+
+
+def _lazy_import_sdk() -> None:
+    """Import claude_agent_sdk and the subagent factories on first call."""
+    global AgentDefinition, ClaudeAgentOptions, ClaudeSDKClient, TextBlock
+    global ThinkingBlock, ToolUseBlock, ToolResultBlock, ResultMessage
+    global create_wikipedia_subagent, create_magento_admin_subagent
+    global _SDK_IMPORTED, _IMPORT_ERROR
+
+    if _SDK_IMPORTED:
+        return
+    _SDK_IMPORTED = True
+
+    try:
+        from claude_agent_sdk import (
+            AgentDefinition,
+            ClaudeAgentOptions,
+            ClaudeSDKClient,
+            TextBlock,
+            ThinkingBlock,
+            ToolUseBlock,
+            ToolResultBlock,
+            ResultMessage,
+        )
+        from agent.wikipedia_subagent import create_wikipedia_subagent
+        from agent.magento_admin_subagent import create_magento_admin_subagent
+    except ImportError as exc:
+        logger.error("Failed to import claude_agent_sdk: %s", exc)
+        ClaudeSDKClient = None
+        _IMPORT_ERROR = exc
+    else:
+        _BLOCK_KINDS.update({
+            ThinkingBlock: "thinking",
+            TextBlock: "text",
+            ToolUseBlock: "tool_use",
+            ToolResultBlock: "tool_result",
+        })
+
+
+def _block_kind(block: Any) -> Optional[str]:
+    """Classify a content block, falling back to isinstance for subclasses."""
+    kind = _BLOCK_KINDS.get(type(block))
+    if kind is None:
+        for cls, name in _BLOCK_KINDS.items():
+            if isinstance(block, cls):
+                return name
+    return kind
+
+
 try:
-    # Claude Code SDK
-    from claude_agent_sdk import (
-        AgentDefinition,
-        ClaudeAgentOptions,
-        ClaudeSDKClient,
-        TextBlock,
-        ThinkingBlock,
-        ToolUseBlock,
-        ToolResultBlock,
-        ResultMessage,
-    )
-    from agent.wikipedia_subagent import create_wikipedia_subagent
-    from agent.magento_admin_subagent import create_magento_admin_subagent
-except ImportError as exc:
-    logger.error(f"Failed to import claude_agent_sdk: {exc}")
-    ClaudeSDKClient = None
-    _IMPORT_ERROR = exc
-else:
-    _IMPORT_ERROR = None
+    # Optional faster event loop for the background Claude session thread
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# GBOX MCP tools exposed to Claude (prefixed with the MCP server name)
+_MCP_TOOL_NAMES = (
+    "screenshot",
+    "click",
+    "hover",
+    "type",
+    "scroll",
+    "press_key",
+    "wait",
+    "list_tabs",
+    "switch_tab",
+    "close_tab",
+)
+
+# Block file modification tools - keep Bash and Read
+_DISALLOWED_TOOLS = (
+    "Write",  # Block creating/overwriting files
+    "Edit",   # Block editing files
+    "Glob",   # Block file searching
+)
+
+# Sites each subagent is useful for; a task whose config lists none of them
+# doesn't get that subagent advertised (unknown sites keep the full set).
+# The Wikipedia researcher is not listed, so it is always advertised: the
+# general tips of the prompt point to it for any address question.
+_SUBAGENT_SITES = {
+    "magento-admin-guide": ("shopping_admin",),
+}
+
+# SDK stdout buffer size. Screenshots arrive already PNG-encoded from the gbox
+# MCP server and are forwarded to the model by the CLI before this client sees
+# them, so they cannot be re-encoded here; size the buffer for them instead.
+_MAX_BUFFER_SIZE = 10 * 1024 * 1024  # 10MB for screenshots
+
+# Base64 image payloads scrubbed from logged tool results ('data': '...' or
+# "data": "..."; the backreference keeps the quote style consistent)
+_IMAGE_DATA_RE = re.compile(r"""(['"])data\1: \1[A-Za-z0-9+/=]{100,}\1""")
+_IMAGE_DATA_REPLACEMENT = r"\1data\1: \1<image_bytes_removed>\1"
+
+# Escape sequences Claude may include in the complete_task answer
+_ANSWER_ESCAPES = {"\\'": "'", '\\"': '"', "\\\\": "\\"}
+_ANSWER_ESCAPE_RE = re.compile(r"\\\\|\\\"|\\'")
+
+# Pause after Ctrl+R before starting the recovery session. Starting a new
+# session and the model's first turn already take longer than a reload, so only
+# a short settle time is needed here.
+_REFRESH_SETTLE_SECONDS = 0.5
+
+# Bounded formatter for logged tool inputs (truncates while formatting, so
+# large inputs are never rendered in full just to be cut to 500 chars)
+_TOOL_INPUT_REPR = reprlib.Repr()
+_TOOL_INPUT_REPR.maxstring = 500
+_TOOL_INPUT_REPR.maxother = 500
+_TOOL_INPUT_REPR.maxdict = 20
+_TOOL_INPUT_REPR.maxlist = 20
+
+# System prompt section for each subagent; the sections of the subagents a
+# task advertises fill the {subagent_sections} slot of the prompt
+_SUBAGENT_PROMPT_SECTIONS = {
+    "wikipedia-researcher": """\
+═══════════════════════════════════════════════════════════════════════
+WIKIPEDIA SUBAGENT:
+═══════════════════════════════════════════════════════════════════════
+
+- Task(subagent_type="wikipedia-researcher", prompt="Your specific question"):
+  Use ONLY when you need information from Wikipedia. Be EXTREMELY SPECIFIC about what you need.
+  Date interpretation: "after 2020" means from 2020 onwards (2020, 2021, 2022, ...)
+  so be sure to include 2020 as part of the search.
+
+  **For address queries**: Ask for "complete street address including street number"
+  Example: "What is the complete street address (including street number) of Pittsburgh International Airport?"
+
+  The subagent uses a search-first strategy with voting to cross-verify facts from multiple sources.
+
+  IMPORTANT - Handling Wikipedia Subagent Results:
+  1. Read the **Confidence** level - if Low or Medium, consider the suggestions
+  2. Check **Uncertainties** - if there are significant gaps, decide if you need more info
+  3. Review **Suggestions** - if the subagent suggests further exploration:
+     - Navigate to Wikipedia manually to verify specific details
+     - Check additional sources if dates/numbers are uncertain
+     - Cross-reference with other parts of the website if needed
+  4. If Confidence is High and no uncertainties, proceed with the answer
+
+""",
+    "magento-admin-guide": """\
+═══════════════════════════════════════════════════════════════════════
+MAGENTO ADMIN SUBAGENT - YOUR MAGENTO EXPERT:
+═══════════════════════════════════════════════════════════════════════
+
+Think of this subagent as a PROFESSIONAL MAGENTO ADMINISTRATOR who knows the system inside-out.
+Whenever you have ANY question or hit ANY roadblock with Magento Admin, ask the subagent!
+
+- Task(subagent_type="magento-admin-guide", prompt="Your specific question"):
+  Example: "Where can I find best-selling products report?"
+  Returns the exact Admin menu path (e.g., "Reports > Products > Bestsellers").
+
+⚠️ WHEN TO USE (use liberally!):
+- At the START of any Magento task - ask where to find what you need
+- When you're STUCK - don't waste time exploring, ask the expert
+- When you see confusing UI - ask how to interpret or use it
+- When you need to find reports, customer data, orders, products, or any admin feature
+- If you hit any roadblock or don't know what to do next - ASK!
+
+The subagent is FAST and knows EXACTLY where everything is. Don't hesitate to use it!
+
+""",
+}
+
+# Default system prompt for WebArena tasks.
+_DEFAULT_PROMPT = """\
+You are an autonomous intelligent agent tasked with completing web-based tasks.
+You are working on FAKE TESTING WEBSITES - clones designed to test AI agents.
+You are on the East Coast time zone and the year is 2025.
+
+⚙️ GBOX ENVIRONMENT:
+- Profile name: byteblaze
+- You are operating through the gbox-mcp server with this profile
+
+═══════════════════════════════════════════════════════════════════════
+YOUR TASK:
+═══════════════════════════════════════════════════════════════════════
+
+OBJECTIVE: {intent}
+CURRENT URL: {url}
+
+⚠️ CRITICAL: ONLY use these test websites. NEVER navigate to real websites like:
+   google.com, wikipedia.org, reddit.com, etc.
+
+═══════════════════════════════════════════════════════════════════════
+AVAILABLE TOOLS (all require boxId='{box_id}'):
+═══════════════════════════════════════════════════════════════════════
+
+- screenshot(boxId): Capture current screen state
+- click(boxId, target): Click on element (describe the elements extremely precisely)
+- hover(boxId, target): Hover over element to reveal dropdowns, tooltips, or expandable menus.
+  **CRITICAL FOR NESTED DROPDOWNS**: When you hover over a menu item and a dropdown appears, you MUST hover over items in that dropdown to check if there are sub-dropdowns before clicking anything. DO NOT click immediately - first explore all nested levels by hovering. Many navigation menus have multiple nested levels (e.g., Category → Subcategory → Sub-subcategory).
+- type(boxId, content, pressEnterAfterType): Type text into focused field
+- scroll(boxId, direction, distance): Scroll up means it will show the top of page and scroll down will move towards the bottom of page
+- press_key(boxId, keys): Press keyboard keys (Use these when possible instead of clicking back button or any other clicks. Can be useful to scroll to the end of a page or top of a page rather than using scroll. These are always most reliable)
+- wait(boxId, duration): Wait for specified milliseconds
+- list_tabs(boxId): List all open browser tabs
+- switch_tab(boxId, tabId): Switch to a specific tab (ALWAYS list_tabs first so you know what tabId to switch to)
+- close_tab(boxId, tabId): Close a tab (NEVER CLOSE CDP URL PAGE)
+
+═══════════════════════════════════════════════════════════════════════
+RUNTIME RESTRICTIONS & SESSION RULES
+═══════════════════════════════════════════════════════════════════════
+
+⚠️ The environment ALREADY has an active browser session running in a sandbox.
+- You MUST reuse the existing browser box:
+    boxId = '{box_id}'
+- NEVER call or request: start_browser_box, new tab launch, or any new browser start.
+- Do NOT request new network connections (curl, fetch, http GET/POST, etc.)
+- All navigation and interaction MUST happen through the existing authenticated browser UI.
+- Direct curl or HTTP requests from the shell will NOT work (they are unauthenticated).
+- The CLI is read-only and cannot modify files or execute shell commands that require approval.
+- NOTE: There is no point in reading the file system because it is my local machine and not the terminal of the box you are operating on. 
+- So don't bother using bash to explore because it is not the file system of the machine you are working on.
+
+✅ Always continue from the CURRENT PAGE CONTEXT.
+- Scroll, click, and read from the current tab only.
+- Use screenshot() first if you’re unsure where you are.
+- Do not reload or open new windows.
+- If a “browser control” error appears, verify you are still using the same boxId.
+
+{subagent_sections}═══════════════════════════════════════════════════════════════════════
+IMPORTANT RULES:
+═══════════════════════════════════════════════════════════════════════
+
+1. ONLY use the test websites listed above
+2. Take screenshots frequently to see what's on screen
+3. Think step-by-step before each action
+4. Be specific with target descriptions (e.g., "Submit button in login form")
+5. Look at every thing on the website. Be extremely meticulous because every piece of information matters.
+6. When you read literal values (addresses, prices, measurements, names), copy them verbatim from the UI—do not rewrite, reformat, or substitute alternate wording.
+7. Go through all the pages and if you need to keep track of information make a list and keep track of it that way
+
+
+═══════════════════════════════════════════════════════════════════════
+GENERAL TIPS/Benchmark Quirks (VERY IMPORTANT):
+═══════════════════════════════════════════════════════════════════════
+
+1. It's MUCH easier to find something on a website when there's a search bar instead of having to scroll through the whole page trying to locate it.
+2. When asked to do a search task or information retrieval, it can be very useful to use FILTERS to narrow down the search results.
+3. There are a lot of information so it will take a very long time if you just keep scrolling trying to find it. Best way is to search or filter it!
+4. Examine screenshots thoroughly, especially keep an eye out for signs like this "-". These could be negative signs which are important.
+5. When the task asks to return customers, call complete_task() with the FULL Customer name (only if you know the full name).
+6. When asked about how much is spent on a certain category or some description is given. Assume it is specifically about that categroy ONLY. An order might consist of several different categories of products. ONLY select ones that are specifically asked about.
+7. **THIS IS IMPORTANT**: When asked about how is spent on a category include the shipping & handling as part of the cost calculation. The ORDER TOTAL will include both the shipping and handling cost as well.
+    Ex: If there are two items in an order and the shipping & handling is $10.00 then each item would be charged $5. (Split the shipping and handling evenly amongst the number of orders.)
+8. For questions ONLY about **Nintendo Switch game cards** please navigate back to the url of the product you end up choosing. This is because the benchmark evalautes using the page you are on for the Nintendo task. If you are own the wrong product page it will assume you selected that product.
+9. When asked to "show me products under a price" the benchmark evaluates based on the url. so just ensure the price is under the price asked for in the url.
+10. When asked about product type don't return the acutal product name but rather the type of product it is. Ex: If the most common products are "harry potter" and "twilight" the product type is "books".
+11. When the task asks for the full address make sure to inclue **ZIP CODE** (this means choosing the address that has a zip code).
+12. **For ADDRESS questions**: A "full address" means a COMPLETE street address with ALL components (GET THE ADDRESS ALWAYS FROM OPENSTREETMAP!):
+    - Street number (e.g., "1000")
+    - Street name (e.g., "Airport Boulevard" or "International Drive")
+    - City or Township
+    - State
+    - ZIP code
+    - Country (if applicable)
+    Example: "1000 Airport Boulevard, Pittsburgh, PA 15231, United States"
+    If OpenStreetMap doesn't have the street number, try:
+    - Using the Wikipedia subagent to find the official address
+    - Searching for the location's "Contact" or "About" page
+    - Cross-referencing multiple sources until you have the complete address
+13. Task wording can contain typos or singular/plural mismatches. Treat singular terms like "order" or "transaction" as potentially plural. If multiple entries match the described criteria, summarize all of them, list each matching item with its key details, make the quantity explicit, and when the question asks for an amount/total, include the combined sum alongside the itemized numbers. Never assume "the most recent one" unless the instructions explicitly say so.
+14. **For SHOPPING/BROWSING tasks**: When asked to browse products in a particular category, navigate using the dropdown menus (not search) when possible. This may require hovering over nested dropdowns (e.g., hover over "Electronics" → hover over "Computers" → click "Laptops"). Use the hover tool to reveal these nested menus before clicking.
+15. **When URLs/text are TRUNCATED with copy buttons**: If you see text that's cut off in the UI (e.g., "https://example.com/very-long-url..." with a copy button), click the copy button then PASTE it somewhere to see the full content:
+    - Click the URL/address bar and press Ctrl+V
+    - Or paste into a text field
+    - Take a screenshot to see the complete untruncated text
+16. **For GitLab repository changes**: When asked to make changes to a repository, commit changes to the main branch UNLESS the task specifically asks you to create a branch, make a merge request, or follow a different workflow.
+17. **For GitLab SSH clone URLs**: Replace git@ec2-3-149-78-74.us-east-2.compute.amazonaws.com with git@metis.lti.cs.cmu.edu in the clone command.
+18. **For Postmill forum submissions**: When creating a post/submission, put all content including URLs in the Body field. Leave the URL field empty. Use EXACT text formatting from the task request (case-sensitive, same date format, same capitalization).
+19. **When asked to DRAFT a message/email/post**: DO NOT submit or send it. Just compose/write the draft and leave it in the compose window. The evaluator will assess the draft as-is. Only send/submit if explicitly instructed to do so.
+
+
+═══════════════════════════════════════════════════════════════════════
+ANSWER FORMAT (VERY IMPORTANT):
+═══════════════════════════════════════════════════════════════════════
+
+When you call complete_task(), follow these principles:
+
+1. **Match the format exactly**: If examples show "557m", use that exact format
+2. **Provide complete answers**: Include sufficient context for the answer to stand alone
+3. **Add reasoning when appropriate**: For questions requiring judgment (yes/no, status checks,
+   comparisons), include brief context or reasoning alongside your answer
+4. **Be precise with terminology**: Use exact wording from the source when copying text
+5. When asked to return answer in MM:COUNT format, return like this: "January: 1". It expect MM to be the explicit name of the month NOT a number.
+6. When asked how much is spent return just the decimal. So if item costs $7.50 return complete_task(finalAnswer="7.50") or if it costs $0 return complete_task(finalAnswer="0")
+7. When asked for configuration return as 2x2 instead of 2*2.
+8. If multiple matching entries exist for an amount-based question, itemize each amount in your reasoning and ensure the finalAnswer string contains the combined total (e.g., sum of all matching refunds) that satisfies the query.
+
+═══════════════════════════════════════════════════════════════════════
+WORKFLOW:
+═══════════════════════════════════════════════════════════════════════
+
+1. Call list_tabs to see what all are open. 
+   NEVER EVER EVER SWITCH TO TAB WITHOUT list_tabs done first
+   NEVER SWITCH TO TAB THAT HAS (THIS IS CDP URL PAGE):
+   "title": "New Tab",
+   "url": "chrome://new-tab-page/"
+2. Take screenshot to see current state (request it in the SAME message as list_tabs - independent read-only calls can be issued together in one turn)
+3. Think step-by-step about what you need to do
+4. Execute actions one at a time
+5. Verify with screenshots after important actions
+6. Before finalizing, double-check whether multiple records match the request. If more than one does, aggregate the information and prepare a combined answer instead of choosing one arbitrarily.
+6a. **For ADDRESS tasks specifically**: Before calling complete_task(), verify you have ALL components:
+    ✅ Street number (e.g., "1000")
+    ✅ Street name (e.g., "Airport Boulevard")
+    ✅ City/Township
+    ✅ State + ZIP code
+    If ANY component is missing, DO NOT call complete_task() yet. Continue searching until you find the complete address.
+7. When you have the answer, call complete_task() with EXACT format
+8. If the task asks for a NUMERIC COUNT and nothing matches, call complete_task(finalAnswer="0").
+9. Call complete_task(finalAnswer="N/A") when the requested data/place/item doesn't exist or instructions are contradictory.
+10. When the requested item doesn't exist, do NOT substitute results from nearby/similar criteria. If you do this you WILL FAIL the evaluation.
+
+
+═══════════════════════════════════════════════════════════════════════
+FINALIZATION & COMPLETION RULES (MANDATORY)
+═══════════════════════════════════════════════════════════════════════
+
+🚨 YOU MUST call the tool mcp__task-completion__complete_task({{'finalAnswer': '...'}}) once you know the answer.
+
+- Never just say "The task is complete" or print the answer as text.
+  That does NOT count — the evaluation system only accepts the tool call.
+- Before calling complete_task(), verify that the value you pass matches all instructions: if multiple records meet the criteria, the number must reflect their combined total, not a single example."""
+
+
+# Recovery prompt used after an image processing error (built only on that path)
+_RECOVERY_PROMPT_TEMPLATE = textwrap.dedent(
+    """
+    ═══════════════════════════════════════════════════════════════════════
+    🔄 RECOVERING FROM TECHNICAL ERROR
+    ═══════════════════════════════════════════════════════════════════════
+
+    You encountered a temporary image processing error. The browser session is
+    still active and ready to continue. Here's what happened:
+
+    ═══════════════════════════════════════════════════════════════════════
+    YOUR TASK (unchanged):
+    ═══════════════════════════════════════════════════════════════════════
+
+    OBJECTIVE: {intent}
+
+    ═══════════════════════════════════════════════════════════════════════
+    CURRENT STATE:
+    ═══════════════════════════════════════════════════════════════════════
+
+    - Box ID: {box_id}
+    - Current URL: {url}
+    - Step: {step}
+    - Browser: ALREADY OPEN (do not start a new browser)
+
+    ═══════════════════════════════════════════════════════════════════════
+    WHAT YOU DID BEFORE THE ERROR (last 15 messages):
+    ═══════════════════════════════════════════════════════════════════════
+
+    {transcript_text}
+
+    {action_history_section}
+
+    ═══════════════════════════════════════════════════════════════════════
+    ⚠️  CRITICAL RECOVERY INSTRUCTIONS:
+    ═══════════════════════════════════════════════════════════════════════
+
+    1. DO NOT use mcp__gbox-browser__start_browser_box (browser already exists)
+    2. DO NOT ask for permissions (you already have them)
+    3. DO take a screenshot FIRST to see the current page state
+    4. DO continue from where you left off based on the transcript above
+    5. The page was just refreshed, so you may need to re-navigate if needed
+
+    ═══════════════════════════════════════════════════════════════════════
+    AVAILABLE TOOLS (all require boxId='{box_id}'):
+    ═══════════════════════════════════════════════════════════════════════
+
+    - screenshot(boxId): Capture current screen state (START WITH THIS!)
+    - list_tabs(boxId): List all open browser tabs
+    - click(boxId, target): Click on element
+    - hover(boxId, target): Hover to reveal dropdowns/menus. IMPORTANT: Fully explore nested menus by hovering over dropdown items to check for sub-menus before clicking.
+    - type(boxId, content, pressEnterAfterType): Type text
+    - scroll(boxId, direction, distance): Scroll page
+    - press_key(boxId, keys): Press keyboard keys
+    - wait(boxId, duration): Wait milliseconds
+    - switch_tab(boxId, tabId): Switch to a specific tab
+    - close_tab(boxId, tabId): Close a tab
+    - complete_task(finalAnswer): SIGNAL TASK COMPLETION (REQUIRED!)
+
+    ═══════════════════════════════════════════════════════════════════════
+    🚨 CRITICAL: REMEMBER TO CALL complete_task() WHEN DONE! 🚨
+    ═══════════════════════════════════════════════════════════════════════
 
+    YOU MUST call complete_task(finalAnswer="your answer") to finish the task.
+    Just saying "task is complete" in text will NOT work - you MUST call the tool!
+
+    ═══════════════════════════════════════════════════════════════════════
+
+    START BY TAKING A SCREENSHOT to see the current state, then continue
+    working on the task: {intent}
+    """
+).strip()
+
+_RECOVERY_ACTIONS_SECTION = """\
+═══════════════════════════════════════════════════════════════════════
+ACTIONS TAKEN:
+═══════════════════════════════════════════════════════════════════════
+
+"""
 
 class GboxClaudeAgent:
     """
@@ -72,6 +480,7 @@ class GboxClaudeAgent:
             use_bedrock: Whether to use AWS Bedrock (vs Anthropic API)
             fallback_model: Fallback model to use on errors
         """
+        _lazy_import_sdk()
         if ClaudeSDKClient is None:
             raise ImportError(
                 "claude_agent_sdk not available. Install with: pip install claude-agent-sdk"
@@ -87,6 +496,14 @@ class GboxClaudeAgent:
 
         # Session management
         self._session_id: Optional[str] = None
+        self._client: Optional["ClaudeSDKClient"] = None
+        self._client_stack: Optional[contextlib.AsyncExitStack] = None
+        self._client_model: Optional[str] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set while the open client was connected ahead of time by reset() and
+        # has not sent a query yet
+        self._client_unused = False
+        self._preconnect: Optional[concurrent.futures.Future] = None
         self._completed = False
         self._final_answer: Optional[str] = None
         self._step_count = 0
@@ -95,288 +512,117 @@ class GboxClaudeAgent:
         self._image_error_count = 0
         self._max_image_error_retries = 2
 
-        # Claude options
-        self._claude_options = self._create_claude_options()
-
-        # System prompt
-        self._prompt_template = prompt_template or self._default_prompt()
-
-    def _create_claude_options(self, use_sonnet_4: bool = False) -> ClaudeAgentOptions:
-        """Create Claude SDK options with MCP tool access.
-
-        Args:
-            use_sonnet_4: If True, use fallback model instead of default model
-        """
-        # Define allowed tools
-        tool_names = [
-            "screenshot",
-            "click",
-            "hover",
-            "type",
-            "scroll",
-            "press_key",
-            "wait",
-            "list_tabs",
-            "switch_tab",
-            "close_tab",
-        ]
-        allowed_tools = [f"mcp__{self.server_name}__{tool}" for tool in tool_names]
-
-        # Add task completion tool
-        allowed_tools.append("mcp__task-completion__complete_task")
-
-        # Add Task tool to enable subagent invocation
-        allowed_tools.append("Task")
-
-        # Choose model
-        model = self.fallback_model if use_sonnet_4 else self.model
-
-        # Resume from previous session if available
-        resume_session = self._session_id if self._session_id else None
+        # Allowed tools depend only on server_name, so build them once
+        self._allowed_tools = tuple(
+            f"mcp__{self.server_name}__{tool}" for tool in _MCP_TOOL_NAMES
+        ) + (
+            "mcp__task-completion__complete_task",  # Task completion tool
+            "Task",  # Enable subagent invocation
+        )
 
-        # Configure environment variables for Bedrock
-        env_vars = {}
+        # Configure environment variables for Bedrock (read once per agent)
+        self._env_vars: dict[str, str] = {}
         if self.use_bedrock:
-            env_vars = {
+            self._env_vars = {
                 "CLAUDE_CODE_USE_BEDROCK": "true",
                 "AWS_ACCESS_KEY_ID": os.environ.get("AWS_ACCESS_KEY_ID", ""),
                 "AWS_SECRET_ACCESS_KEY": os.environ.get("AWS_SECRET_ACCESS_KEY", ""),
                 "AWS_REGION": os.environ.get("AWS_REGION", "us-west-2"),
             }
 
-        # Create subagents
-        agents = {}
-        agents.update(create_wikipedia_subagent(self.box_id, self.server_name))
-        agents.update(create_magento_admin_subagent(self.box_id, self.server_name))
+        # Subagents depend only on box_id/server_name, so create them once
+        self._agents = {}
+        self._agents.update(create_wikipedia_subagent(self.box_id, self.server_name))
+        self._agents.update(create_magento_admin_subagent(self.box_id, self.server_name))
+
+        # Long-lived event loop in a dedicated thread (avoid event loop conflicts
+        # and per-step thread/loop creation)
+        self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="claude-session", daemon=True
+        )
+        self._loop_thread.start()
 
-        # Block file modification tools - keep Bash and Read
-        disallowed_tools = [
-            "Write",  # Block creating/overwriting files
-            "Edit",   # Block editing files
-            "Glob",   # Block file searching
-        ]
+        # Claude options
+        self._base_options = self._create_base_options()
+        self._claude_options = self._base_options
+
+        self._subagent_sections = self._prompt_sections(self._base_options)
+
+        # System prompt (box_id is fixed per agent, so bake it in once)
+        self._prompt_template = (prompt_template or _DEFAULT_PROMPT).replace(
+            "{box_id}", self.box_id
+        )
 
+    def _create_base_options(self) -> "ClaudeAgentOptions":
+        """Create the session-independent Claude SDK options with MCP tool access."""
         return ClaudeAgentOptions(
             setting_sources=["user", "project", "local"],
-            allowed_tools=allowed_tools,
-            disallowed_tools=disallowed_tools,
+            allowed_tools=list(self._allowed_tools),
+            disallowed_tools=list(_DISALLOWED_TOOLS),
             permission_mode="acceptEdits",
-            model=model,
-            max_buffer_size=10 * 1024 * 1024,  # 10MB for screenshots
-            resume=resume_session,
-            env=env_vars,
-            agents=agents,
+            model=self.model,
+            max_buffer_size=_MAX_BUFFER_SIZE,
+            env=self._env_vars,
+            agents=self._agents,
+        )
+
+    def _create_task_options(self, test_config_file: str) -> "ClaudeAgentOptions":
+        """Create base options advertising only the subagents the task's sites need.
+
+        Args:
+            test_config_file: Path to task config JSON
+        """
+        try:
+            with open(test_config_file) as f:
+                sites = set(json.load(f).get("sites") or [])
+        except (OSError, ValueError, AttributeError, TypeError):
+            sites = set()
+
+        # Ambiguous or unknown sites: keep every subagent
+        if not sites:
+            return self._base_options
+
+        agents = {
+            name: definition
+            for name, definition in self._agents.items()
+            if sites.intersection(_SUBAGENT_SITES.get(name, sites))
+        }
+        if len(agents) == len(self._agents):
+            return self._base_options
+
+        allowed_tools = list(self._allowed_tools)
+        if not agents:
+            allowed_tools.remove("Task")
+        return dataclasses.replace(
+            self._base_options, agents=agents, allowed_tools=allowed_tools
+        )
+
+    @staticmethod
+    def _prompt_sections(options: "ClaudeAgentOptions") -> str:
+        """Return the system prompt sections of the subagents options advertises."""
+        return "".join(
+            _SUBAGENT_PROMPT_SECTIONS.get(name, "") for name in options.agents or ()
         )
 
-    def _default_prompt(self) -> str:
-        """Default system prompt for WebArena tasks."""
-        return textwrap.dedent(
-            """
-            You are an autonomous intelligent agent tasked with completing web-based tasks.
-            You are working on FAKE TESTING WEBSITES - clones designed to test AI agents.
-            You are on the East Coast time zone and the year is 2025.
-
-            ⚙️ GBOX ENVIRONMENT:
-            - Profile name: byteblaze
-            - You are operating through the gbox-mcp server with this profile
-
-            ═══════════════════════════════════════════════════════════════════════
-            YOUR TASK:
-            ═══════════════════════════════════════════════════════════════════════
-
-            OBJECTIVE: {intent}
-            CURRENT URL: {url}
-
-            ⚠️ CRITICAL: ONLY use these test websites. NEVER navigate to real websites like:
-               google.com, wikipedia.org, reddit.com, etc.
-
-            ═══════════════════════════════════════════════════════════════════════
-            AVAILABLE TOOLS (all require boxId='{box_id}'):
-            ═══════════════════════════════════════════════════════════════════════
-
-            - screenshot(boxId): Capture current screen state
-            - click(boxId, target): Click on element (describe the elements extremely precisely)
-            - hover(boxId, target): Hover over element to reveal dropdowns, tooltips, or expandable menus.
-              **CRITICAL FOR NESTED DROPDOWNS**: When you hover over a menu item and a dropdown appears, you MUST hover over items in that dropdown to check if there are sub-dropdowns before clicking anything. DO NOT click immediately - first explore all nested levels by hovering. Many navigation menus have multiple nested levels (e.g., Category → Subcategory → Sub-subcategory).
-            - type(boxId, content, pressEnterAfterType): Type text into focused field
-            - scroll(boxId, direction, distance): Scroll up means it will show the top of page and scroll down will move towards the bottom of page
-            - press_key(boxId, keys): Press keyboard keys (Use these when possible instead of clicking back button or any other clicks. Can be useful to scroll to the end of a page or top of a page rather than using scroll. These are always most reliable)
-            - wait(boxId, duration): Wait for specified milliseconds
-            - list_tabs(boxId): List all open browser tabs
-            - switch_tab(boxId, tabId): Switch to a specific tab (ALWAYS list_tabs first so you know what tabId to switch to)
-            - close_tab(boxId, tabId): Close a tab (NEVER CLOSE CDP URL PAGE)
-
-            ═══════════════════════════════════════════════════════════════════════
-            RUNTIME RESTRICTIONS & SESSION RULES
-            ═══════════════════════════════════════════════════════════════════════
-
-            ⚠️ The environment ALREADY has an active browser session running in a sandbox.
-            - You MUST reuse the existing browser box:
-                boxId = '{box_id}'
-            - NEVER call or request: start_browser_box, new tab launch, or any new browser start.
-            - Do NOT request new network connections (curl, fetch, http GET/POST, etc.)
-            - All navigation and interaction MUST happen through the existing authenticated browser UI.
-            - Direct curl or HTTP requests from the shell will NOT work (they are unauthenticated).
-            - The CLI is read-only and cannot modify files or execute shell commands that require approval.
-            - NOTE: There is no point in reading the file system because it is my local machine and not the terminal of the box you are operating on. 
-            - So don't bother using bash to explore because it is not the file system of the machine you are working on.
-
-            ✅ Always continue from the CURRENT PAGE CONTEXT.
-            - Scroll, click, and read from the current tab only.
-            - Use screenshot() first if you’re unsure where you are.
-            - Do not reload or open new windows.
-            - If a “browser control” error appears, verify you are still using the same boxId.
-
-            ═══════════════════════════════════════════════════════════════════════
-            WIKIPEDIA SUBAGENT:
-            ═══════════════════════════════════════════════════════════════════════
-
-            - Task(subagent_type="wikipedia-researcher", prompt="Your specific question"):
-              Use ONLY when you need information from Wikipedia. Be EXTREMELY SPECIFIC about what you need.
-              Date interpretation: "after 2020" means from 2020 onwards (2020, 2021, 2022, ...)
-              so be sure to include 2020 as part of the search.
-
-              **For address queries**: Ask for "complete street address including street number"
-              Example: "What is the complete street address (including street number) of Pittsburgh International Airport?"
-
-              The subagent uses a search-first strategy with voting to cross-verify facts from multiple sources.
-
-              IMPORTANT - Handling Wikipedia Subagent Results:
-              1. Read the **Confidence** level - if Low or Medium, consider the suggestions
-              2. Check **Uncertainties** - if there are significant gaps, decide if you need more info
-              3. Review **Suggestions** - if the subagent suggests further exploration:
-                 - Navigate to Wikipedia manually to verify specific details
-                 - Check additional sources if dates/numbers are uncertain
-                 - Cross-reference with other parts of the website if needed
-              4. If Confidence is High and no uncertainties, proceed with the answer
-
-            ═══════════════════════════════════════════════════════════════════════
-            MAGENTO ADMIN SUBAGENT - YOUR MAGENTO EXPERT:
-            ═══════════════════════════════════════════════════════════════════════
-
-            Think of this subagent as a PROFESSIONAL MAGENTO ADMINISTRATOR who knows the system inside-out.
-            Whenever you have ANY question or hit ANY roadblock with Magento Admin, ask the subagent!
-
-            - Task(subagent_type="magento-admin-guide", prompt="Your specific question"):
-              Example: "Where can I find best-selling products report?"
-              Returns the exact Admin menu path (e.g., "Reports > Products > Bestsellers").
-
-            ⚠️ WHEN TO USE (use liberally!):
-            - At the START of any Magento task - ask where to find what you need
-            - When you're STUCK - don't waste time exploring, ask the expert
-            - When you see confusing UI - ask how to interpret or use it
-            - When you need to find reports, customer data, orders, products, or any admin feature
-            - If you hit any roadblock or don't know what to do next - ASK!
-
-            The subagent is FAST and knows EXACTLY where everything is. Don't hesitate to use it!
-
-            ═══════════════════════════════════════════════════════════════════════
-            IMPORTANT RULES:
-            ═══════════════════════════════════════════════════════════════════════
-
-            1. ONLY use the test websites listed above
-            2. Take screenshots frequently to see what's on screen
-            3. Think step-by-step before each action
-            4. Be specific with target descriptions (e.g., "Submit button in login form")
-            5. Look at every thing on the website. Be extremely meticulous because every piece of information matters.
-            6. When you read literal values (addresses, prices, measurements, names), copy them verbatim from the UI—do not rewrite, reformat, or substitute alternate wording.
-            7. Go through all the pages and if you need to keep track of information make a list and keep track of it that way
-
-
-            ═══════════════════════════════════════════════════════════════════════
-            GENERAL TIPS/Benchmark Quirks (VERY IMPORTANT):
-            ═══════════════════════════════════════════════════════════════════════
-
-            1. It's MUCH easier to find something on a website when there's a search bar instead of having to scroll through the whole page trying to locate it.
-            2. When asked to do a search task or information retrieval, it can be very useful to use FILTERS to narrow down the search results.
-            3. There are a lot of information so it will take a very long time if you just keep scrolling trying to find it. Best way is to search or filter it!
-            4. Examine screenshots thoroughly, especially keep an eye out for signs like this "-". These could be negative signs which are important.
-            5. When the task asks to return customers, call complete_task() with the FULL Customer name (only if you know the full name).
-            6. When asked about how much is spent on a certain category or some description is given. Assume it is specifically about that categroy ONLY. An order might consist of several different categories of products. ONLY select ones that are specifically asked about.
-            7. **THIS IS IMPORTANT**: When asked about how is spent on a category include the shipping & handling as part of the cost calculation. The ORDER TOTAL will include both the shipping and handling cost as well.
-                Ex: If there are two items in an order and the shipping & handling is $10.00 then each item would be charged $5. (Split the shipping and handling evenly amongst the number of orders.)
-            8. For questions ONLY about **Nintendo Switch game cards** please navigate back to the url of the product you end up choosing. This is because the benchmark evalautes using the page you are on for the Nintendo task. If you are own the wrong product page it will assume you selected that product.
-            9. When asked to "show me products under a price" the benchmark evaluates based on the url. so just ensure the price is under the price asked for in the url.
-            10. When asked about product type don't return the acutal product name but rather the type of product it is. Ex: If the most common products are "harry potter" and "twilight" the product type is "books".
-            11. When the task asks for the full address make sure to inclue **ZIP CODE** (this means choosing the address that has a zip code).
-            12. **For ADDRESS questions**: A "full address" means a COMPLETE street address with ALL components (GET THE ADDRESS ALWAYS FROM OPENSTREETMAP!):
-                - Street number (e.g., "1000")
-                - Street name (e.g., "Airport Boulevard" or "International Drive")
-                - City or Township
-                - State
-                - ZIP code
-                - Country (if applicable)
-                Example: "1000 Airport Boulevard, Pittsburgh, PA 15231, United States"
-                If OpenStreetMap doesn't have the street number, try:
-                - Using the Wikipedia subagent to find the official address
-                - Searching for the location's "Contact" or "About" page
-                - Cross-referencing multiple sources until you have the complete address
-            13. Task wording can contain typos or singular/plural mismatches. Treat singular terms like "order" or "transaction" as potentially plural. If multiple entries match the described criteria, summarize all of them, list each matching item with its key details, make the quantity explicit, and when the question asks for an amount/total, include the combined sum alongside the itemized numbers. Never assume "the most recent one" unless the instructions explicitly say so.
-            14. **For SHOPPING/BROWSING tasks**: When asked to browse products in a particular category, navigate using the dropdown menus (not search) when possible. This may require hovering over nested dropdowns (e.g., hover over "Electronics" → hover over "Computers" → click "Laptops"). Use the hover tool to reveal these nested menus before clicking.
-            15. **When URLs/text are TRUNCATED with copy buttons**: If you see text that's cut off in the UI (e.g., "https://example.com/very-long-url..." with a copy button), click the copy button then PASTE it somewhere to see the full content:
-                - Click the URL/address bar and press Ctrl+V
-                - Or paste into a text field
-                - Take a screenshot to see the complete untruncated text
-            16. **For GitLab repository changes**: When asked to make changes to a repository, commit changes to the main branch UNLESS the task specifically asks you to create a branch, make a merge request, or follow a different workflow.
-            17. **For GitLab SSH clone URLs**: Replace git@ec2-3-149-78-74.us-east-2.compute.amazonaws.com with git@metis.lti.cs.cmu.edu in the clone command.
-            18. **For Postmill forum submissions**: When creating a post/submission, put all content including URLs in the Body field. Leave the URL field empty. Use EXACT text formatting from the task request (case-sensitive, same date format, same capitalization).
-            19. **When asked to DRAFT a message/email/post**: DO NOT submit or send it. Just compose/write the draft and leave it in the compose window. The evaluator will assess the draft as-is. Only send/submit if explicitly instructed to do so.
-
-
-            ═══════════════════════════════════════════════════════════════════════
-            ANSWER FORMAT (VERY IMPORTANT):
-            ═══════════════════════════════════════════════════════════════════════
-
-            When you call complete_task(), follow these principles:
-
-            1. **Match the format exactly**: If examples show "557m", use that exact format
-            2. **Provide complete answers**: Include sufficient context for the answer to stand alone
-            3. **Add reasoning when appropriate**: For questions requiring judgment (yes/no, status checks,
-               comparisons), include brief context or reasoning alongside your answer
-            4. **Be precise with terminology**: Use exact wording from the source when copying text
-            5. When asked to return answer in MM:COUNT format, return like this: "January: 1". It expect MM to be the explicit name of the month NOT a number.
-            6. When asked how much is spent return just the decimal. So if item costs $7.50 return complete_task(finalAnswer="7.50") or if it costs $0 return complete_task(finalAnswer="0")
-            7. When asked for configuration return as 2x2 instead of 2*2.
-            8. If multiple matching entries exist for an amount-based question, itemize each amount in your reasoning and ensure the finalAnswer string contains the combined total (e.g., sum of all matching refunds) that satisfies the query.
-
-            ═══════════════════════════════════════════════════════════════════════
-            WORKFLOW:
-            ═══════════════════════════════════════════════════════════════════════
-
-            1. Call list_tabs to see what all are open. 
-               NEVER EVER EVER SWITCH TO TAB WITHOUT list_tabs done first
-               NEVER SWITCH TO TAB THAT HAS (THIS IS CDP URL PAGE):
-               "title": "New Tab",
-               "url": "chrome://new-tab-page/"
-            2. Take screenshot to see current state
-            3. Think step-by-step about what you need to do
-            4. Execute actions one at a time
-            5. Verify with screenshots after important actions
-            6. Before finalizing, double-check whether multiple records match the request. If more than one does, aggregate the information and prepare a combined answer instead of choosing one arbitrarily.
-            6a. **For ADDRESS tasks specifically**: Before calling complete_task(), verify you have ALL components:
-                ✅ Street number (e.g., "1000")
-                ✅ Street name (e.g., "Airport Boulevard")
-                ✅ City/Township
-                ✅ State + ZIP code
-                If ANY component is missing, DO NOT call complete_task() yet. Continue searching until you find the complete address.
-            7. When you have the answer, call complete_task() with EXACT format
-            8. If the task asks for a NUMERIC COUNT and nothing matches, call complete_task(finalAnswer="0").
-            9. Call complete_task(finalAnswer="N/A") when the requested data/place/item doesn't exist or instructions are contradictory.
-            10. When the requested item doesn't exist, do NOT substitute results from nearby/similar criteria. If you do this you WILL FAIL the evaluation.
-
-
-            ═══════════════════════════════════════════════════════════════════════
-            FINALIZATION & COMPLETION RULES (MANDATORY)
-            ═══════════════════════════════════════════════════════════════════════
-
-            🚨 YOU MUST call the tool mcp__task-completion__complete_task({{'finalAnswer': '...'}}) once you know the answer.
-
-            - Never just say "The task is complete" or print the answer as text.
-              That does NOT count — the evaluation system only accepts the tool call.
-            - Before calling complete_task(), verify that the value you pass matches all instructions: if multiple records meet the criteria, the number must reflect their combined total, not a single example.
-
-            """
-        ).strip()
+    def _create_claude_options(self, use_sonnet_4: bool = False) -> "ClaudeAgentOptions":
+        """Create Claude SDK options for a session.
+
+        Only the model and resume session change between sessions, so these are
+        swapped into the base options built in __init__.
+
+        Args:
+            use_sonnet_4: If True, use fallback model instead of default model
+        """
+        # Choose model
+        model = self.fallback_model if use_sonnet_4 else self.model
+
+        # Resume from previous session if available
+        resume_session = self._session_id if self._session_id else None
+
+        return dataclasses.replace(
+            self._claude_options, model=model, resume=resume_session
+        )
 
     def _build_recovery_prompt(
         self, intent: str, url: str, transcript: List[str], meta_data: Any
@@ -394,90 +640,26 @@ class GboxClaudeAgent:
             Recovery prompt with context
         """
         # Get last 15 messages from transcript (enough context without overload)
-        recent_transcript = transcript[-15:] if len(transcript) > 15 else transcript
-        transcript_text = "\n".join(f"  {msg}" for msg in recent_transcript)
+        recent_transcript = transcript[-15:]
+        transcript_text = "\n".join(["  " + msg for msg in recent_transcript])
 
         # Get action history if available
         action_history = ""
         if meta_data and isinstance(meta_data, dict) and "action_history" in meta_data:
             history = meta_data["action_history"][-5:]  # Last 5 actions
-            action_history = "\n".join(f"  - {action}" for action in history)
-
-        return textwrap.dedent(f"""
-            ═══════════════════════════════════════════════════════════════════════
-            🔄 RECOVERING FROM TECHNICAL ERROR
-            ═══════════════════════════════════════════════════════════════════════
-
-            You encountered a temporary image processing error. The browser session is
-            still active and ready to continue. Here's what happened:
-
-            ═══════════════════════════════════════════════════════════════════════
-            YOUR TASK (unchanged):
-            ═══════════════════════════════════════════════════════════════════════
-
-            OBJECTIVE: {intent}
+            action_history = "\n".join(["  - " + str(action) for action in history])
 
-            ═══════════════════════════════════════════════════════════════════════
-            CURRENT STATE:
-            ═══════════════════════════════════════════════════════════════════════
+        if action_history:
+            action_history = _RECOVERY_ACTIONS_SECTION + action_history
 
-            - Box ID: {self.box_id}
-            - Current URL: {url}
-            - Step: {self._step_count}
-            - Browser: ALREADY OPEN (do not start a new browser)
-
-            ═══════════════════════════════════════════════════════════════════════
-            WHAT YOU DID BEFORE THE ERROR (last 15 messages):
-            ═══════════════════════════════════════════════════════════════════════
-
-{transcript_text}
-
-            {f'''
-            ═══════════════════════════════════════════════════════════════════════
-            ACTIONS TAKEN:
-            ═══════════════════════════════════════════════════════════════════════
-
-{action_history}''' if action_history else ''}
-
-            ═══════════════════════════════════════════════════════════════════════
-            ⚠️  CRITICAL RECOVERY INSTRUCTIONS:
-            ═══════════════════════════════════════════════════════════════════════
-
-            1. DO NOT use mcp__gbox-browser__start_browser_box (browser already exists)
-            2. DO NOT ask for permissions (you already have them)
-            3. DO take a screenshot FIRST to see the current page state
-            4. DO continue from where you left off based on the transcript above
-            5. The page was just refreshed, so you may need to re-navigate if needed
-
-            ═══════════════════════════════════════════════════════════════════════
-            AVAILABLE TOOLS (all require boxId='{self.box_id}'):
-            ═══════════════════════════════════════════════════════════════════════
-
-            - screenshot(boxId): Capture current screen state (START WITH THIS!)
-            - list_tabs(boxId): List all open browser tabs
-            - click(boxId, target): Click on element
-            - hover(boxId, target): Hover to reveal dropdowns/menus. IMPORTANT: Fully explore nested menus by hovering over dropdown items to check for sub-menus before clicking.
-            - type(boxId, content, pressEnterAfterType): Type text
-            - scroll(boxId, direction, distance): Scroll page
-            - press_key(boxId, keys): Press keyboard keys
-            - wait(boxId, duration): Wait milliseconds
-            - switch_tab(boxId, tabId): Switch to a specific tab
-            - close_tab(boxId, tabId): Close a tab
-            - complete_task(finalAnswer): SIGNAL TASK COMPLETION (REQUIRED!)
-
-            ═══════════════════════════════════════════════════════════════════════
-            🚨 CRITICAL: REMEMBER TO CALL complete_task() WHEN DONE! 🚨
-            ═══════════════════════════════════════════════════════════════════════
-
-            YOU MUST call complete_task(finalAnswer="your answer") to finish the task.
-            Just saying "task is complete" in text will NOT work - you MUST call the tool!
-
-            ═══════════════════════════════════════════════════════════════════════
-
-            START BY TAKING A SCREENSHOT to see the current state, then continue
-            working on the task: {intent}
-            """
-        ).strip()
+        return _RECOVERY_PROMPT_TEMPLATE.format_map({
+            "intent": intent,
+            "url": url,
+            "box_id": self.box_id,
+            "step": self._step_count,
+            "transcript_text": transcript_text,
+            "action_history_section": action_history,
+        })
 
     def next_action(
         self, trajectory: Trajectory, intent: str, meta_data: Any
@@ -487,6 +669,37 @@ class GboxClaudeAgent:
 
         This is the main interface method that WebArena calls in the evaluation loop.
         We run Claude to completion and return a STOP action with the final answer.
+        Runs next_action_async on the agent's background event loop.
+
+        Args:
+            trajectory: List of previous states and actions
+            intent: Task description/goal
+            meta_data: Additional metadata (e.g., action_history)
+
+        Returns:
+            Action dict (will be a STOP action with the answer)
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.next_action_async(trajectory, intent, meta_data), self._loop
+        )
+        try:
+            return future.result()
+        except BaseException as exc:
+            logger.error("Claude session failed: %s", exc)
+            raise
+
+    async def next_action_async(
+        self, trajectory: Trajectory, intent: str, meta_data: Any
+    ) -> Action:
+        """
+        Generate next action for WebArena (async).
+
+        Drives the Claude session directly on the caller's event loop, so several
+        agents can run concurrently (e.g., with asyncio.gather). The Claude client
+        is always connected on the loop that awaits it; a client from another
+        loop (such as one pre-connected by reset()) is closed on its own loop
+        and replaced. Callers driving the agent this way should reset it with
+        preconnect=False.
 
         Args:
             trajectory: List of previous states and actions
@@ -504,46 +717,47 @@ class GboxClaudeAgent:
 
         # Get current URL from last state
         url = "unknown"
-        if len(trajectory) >= 1:
-            last_state: StateInfo = trajectory[-1]  # type: ignore
-            if isinstance(last_state, dict) and "info" in last_state:
-                url = last_state.get("info", {}).get("url", "unknown")
+        if trajectory:
+            try:
+                url = trajectory[-1]["info"]["url"] or "unknown"  # type: ignore
+            except (KeyError, TypeError):
+                pass
 
         # Format prompt with task details
         if self._step_count == 1:
-            prompt = self._prompt_template.format(
-                intent=intent,
-                url=url,
-                box_id=self.box_id
-            )
+            prompt = self._prompt_template.format_map({
+                "intent": intent,
+                "url": url,
+                "subagent_sections": self._subagent_sections,
+            })
         else:
             # Continuation prompt for multi-step sessions
             prompt = f"Continue task (step {self._step_count}). Goal: {intent}\nCurrent URL: {url}"
 
-        # Run Claude in a dedicated thread (avoid event loop conflicts)
-        final_answer, transcript, is_complete, has_error, has_image_error = self._run_claude_sync(prompt)
+        # Run Claude session
+        final_answer, transcript, is_complete, has_error, has_image_error = await self._run_claude_async(prompt)
 
         # Handle image processing errors by refreshing and starting new session
         if has_image_error:
             if self._image_error_count < self._max_image_error_retries:
                 self._image_error_count += 1
-                logger.warning(f"🖼️ Image processing error detected (attempt {self._image_error_count}/{self._max_image_error_retries})")
+                logger.warning("🖼️ Image processing error detected (attempt %s/%s)", self._image_error_count, self._max_image_error_retries)
 
                 # Refresh the page to get clean screenshot
                 if self.gbox_client:
                     logger.info("🔄 Refreshing page with Ctrl+R...")
                     try:
-                        self.gbox_client.v1.boxes.actions.press_key(
+                        await asyncio.to_thread(
+                            self.gbox_client.v1.boxes.actions.press_key,
                             box_id=self.box_id,
                             keys=['control', 'r']
                         )
                         logger.info("✅ Page refreshed")
 
-                        # Wait a bit for page to reload
-                        import time
-                        time.sleep(2)
+                        # Let the reload start before the recovery session screenshots
+                        await asyncio.sleep(_REFRESH_SETTLE_SECONDS)
                     except Exception as e:
-                        logger.warning(f"Failed to refresh page: {e}")
+                        logger.warning("Failed to refresh page: %s", e)
 
                 # Start a NEW session (discard corrupted one)
                 logger.info("🆕 Starting fresh session with Sonnet 4.5...")
@@ -553,9 +767,9 @@ class GboxClaudeAgent:
                 recovery_prompt = self._build_recovery_prompt(intent, url, transcript, meta_data)
 
                 # Retry with fresh session using context-aware recovery prompt
-                final_answer, transcript, is_complete, has_error, has_image_error = self._run_claude_sync(recovery_prompt)
+                final_answer, transcript, is_complete, has_error, has_image_error = await self._run_claude_async(recovery_prompt)
             else:
-                logger.error(f"❌ Max image error retries ({self._max_image_error_retries}) exceeded, giving up")
+                logger.error("❌ Max image error retries (%s) exceeded, giving up", self._max_image_error_retries)
                 # Treat as task failure
                 self._completed = True
                 action = create_stop_action("ERROR: Could not process image after multiple retries")
@@ -564,12 +778,12 @@ class GboxClaudeAgent:
 
         # If usage error detected, retry with Sonnet 4 (keeps session)
         if has_error:
-            logger.warning(f"⚠️ Usage error detected at step {self._step_count}, retrying with Sonnet 4...")
-            final_answer, transcript, is_complete, has_error, has_image_error = self._run_claude_sync(prompt, use_sonnet_4=True)
+            logger.warning("⚠️ Usage error detected at step %s, retrying with Sonnet 4...", self._step_count)
+            final_answer, transcript, is_complete, has_error, has_image_error = await self._run_claude_async(prompt, use_sonnet_4=True)
 
         if not is_complete:
             # Session incomplete, continue in next step
-            logger.warning(f"Session incomplete at step {self._step_count}, continuing...")
+            logger.warning("Session incomplete at step %s, continuing...", self._step_count)
             # Return a None action to signal continuation
             action = create_stop_action("")
             action["action_type"] = ActionTypes.NONE
@@ -579,7 +793,7 @@ class GboxClaudeAgent:
         self._completed = True
         self._final_answer = final_answer or "No answer provided"
 
-        logger.info(f"🏁 Final answer: {self._final_answer}")
+        logger.info("🏁 Final answer: %s", self._final_answer)
 
         # Return STOP action with answer (WebArena format)
         action = create_stop_action(self._final_answer)
@@ -587,43 +801,125 @@ class GboxClaudeAgent:
 
         return action
 
-    def _run_claude_sync(self, prompt: str, use_sonnet_4: bool = False) -> tuple[Optional[str], List[str], bool, bool, bool]:
-        """
-        Run Claude session synchronously (wraps async call).
+    async def _get_client(self, use_sonnet_4: bool = False) -> "ClaudeSDKClient":
+        """Return the open Claude client, connecting a new one when needed.
+
+        The client is kept open across steps of a task and only recreated when
+        there is no session to continue (new task or discarded session), the
+        model changes, or it was connected on a different event loop than the
+        running one (its streams are bound to that loop). A client pre-connected
+        by reset() is used for the first query of the task. Options are only
+        built when a new client is connected.
 
         Args:
-            prompt: The prompt to send to Claude
-            use_sonnet_4: If True, use Sonnet 4 instead of default
+            use_sonnet_4: If True, use fallback model instead of default model
+        """
+        if self._preconnect is not None:
+            preconnect, self._preconnect = self._preconnect, None
+            try:
+                await asyncio.wrap_future(preconnect)
+            except Exception as e:
+                logger.warning("Failed to pre-connect Claude client: %s", e)
 
-        Returns:
-            (final_answer, transcript, is_complete, has_error, has_image_error)
+        model = self.fallback_model if use_sonnet_4 else self.model
+        if (
+            self._client is not None
+            and self._client_model == model
+            and self._client_loop is asyncio.get_running_loop()
+        ):
+            if self._session_id:
+                logger.info("Continuing session: %s (model: %s)", self._session_id, model)
+                return self._client
+            if self._client_unused:
+                logger.info("Using pre-connected session (model: %s)", model)
+                self._client_unused = False
+                return self._client
+
+        await self._connect_client(use_sonnet_4)
+        return self._client
+
+    async def _connect_client(self, use_sonnet_4: bool = False, unused: bool = False) -> None:
+        """Replace the open client with a newly connected one.
+
+        Args:
+            use_sonnet_4: If True, use fallback model instead of default model
+            unused: Mark the client as connected ahead of its first query
         """
-        result_box: list[tuple[Optional[str], List[str], bool, bool, bool]] = []
-        exc_box: list[BaseException] = []
+        await self._close_client()
 
-        def _runner():
-            loop = asyncio.new_event_loop()
-            try:
-                asyncio.set_event_loop(loop)
-                result = loop.run_until_complete(self._run_claude_async(prompt, use_sonnet_4))
-                result_box.append(result)
-            except BaseException as exc:
-                exc_box.append(exc)
-            finally:
-                loop.close()
+        # Create options (with session resume if available, and model override if needed)
+        options = self._create_claude_options(use_sonnet_4=use_sonnet_4)
 
-        thread = threading.Thread(target=_runner, name="claude-session")
-        thread.start()
-        thread.join()
+        if self._session_id:
+            logger.info("Resuming session: %s (model: %s)", self._session_id, options.model)
+        else:
+            logger.info("Starting new session (model: %s)", options.model)
 
-        if exc_box:
-            logger.error(f"Claude session failed: {exc_box[0]}")
-            raise exc_box[0]
+        stack = contextlib.AsyncExitStack()
+        self._client = await stack.enter_async_context(ClaudeSDKClient(options=options))
+        self._client_stack = stack
+        self._client_model = options.model
+        self._client_loop = asyncio.get_running_loop()
+        self._client_unused = unused
 
-        if not result_box:
-            raise RuntimeError("Claude session produced no result")
+    def _detach_client(
+        self,
+    ) -> tuple[Optional[contextlib.AsyncExitStack], Optional[asyncio.AbstractEventLoop]]:
+        """Forget the open client, returning its exit stack and the loop it runs on."""
+        stack, loop = self._client_stack, self._client_loop
+        self._client = None
+        self._client_stack = None
+        self._client_model = None
+        self._client_loop = None
+        self._client_unused = False
+        return stack, loop
+
+    @staticmethod
+    async def _aclose_stack(stack: contextlib.AsyncExitStack) -> None:
+        """Close a client's exit stack (must run on the client's loop)."""
+        try:
+            await stack.aclose()
+        except Exception as e:
+            logger.warning("Failed to close Claude client: %s", e)
+
+    async def _close_client(self) -> None:
+        """Disconnect the open Claude client, if any, on the loop it was connected on."""
+        stack, loop = self._detach_client()
+        if stack is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await self._aclose_stack(stack)
+        elif loop is not None and loop.is_running():
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self._aclose_stack(stack), loop)
+            )
+        else:
+            logger.warning("Dropping Claude client whose event loop has stopped")
 
-        return result_box[0]
+    def _close_client_sync(self) -> None:
+        """Disconnect the open Claude client from synchronous code."""
+        if self._preconnect is not None:
+            # Let a pending pre-connect finish so its client is the one closed
+            preconnect, self._preconnect = self._preconnect, None
+            try:
+                preconnect.result()
+            except Exception as e:
+                logger.warning("Failed to pre-connect Claude client: %s", e)
+        stack, loop = self._detach_client()
+        if stack is None or loop is None or loop.is_closed():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if loop is running_loop:
+            # Called from a coroutine on the client's own loop, which cannot be
+            # blocked on; close in the background instead
+            loop.create_task(self._aclose_stack(stack))
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._aclose_stack(stack), loop).result()
+        else:
+            logger.warning("Dropping Claude client whose event loop has stopped")
 
     async def _run_claude_async(
         self, prompt: str, use_sonnet_4: bool = False
@@ -638,6 +934,8 @@ class GboxClaudeAgent:
         Returns:
             (final_answer, transcript, is_complete, has_error, has_image_error)
         """
+        # Kept whole: it becomes the action's raw_prediction, and tool results
+        # are already cut to 200 characters below
         transcript: List[str] = []
         final_answer: Optional[str] = None
         is_complete = False
@@ -645,76 +943,74 @@ class GboxClaudeAgent:
         has_image_error = False
 
         # Performance tracking
-        import time
-        last_timestamp = time.time()
-        tool_call_start_time = None
-
-        # Create options (with session resume if available, and model override if needed)
-        options = self._create_claude_options(use_sonnet_4=use_sonnet_4)
-
-        if self._session_id:
-            logger.info(f"Resuming session: {self._session_id} (model: {options.model})")
-        else:
-            logger.info(f"Starting new session (model: {options.model})")
+        last_timestamp_ns = time.monotonic_ns()
+        tool_call_start_ns: Optional[int] = None
+        log_info = logger.isEnabledFor(logging.INFO)
 
-        async with ClaudeSDKClient(options=options) as client:
+        client = await self._get_client(use_sonnet_4)
+        try:
             await client.query(prompt)
             stream = client.receive_response()
             async for message in stream:
                 # Handle content blocks
-                if hasattr(message, 'content') and isinstance(message.content, list):
-                    for block in message.content:
+                message_content = getattr(message, 'content', None)
+                if isinstance(message_content, list):
+                    # Info lines for this message, flushed with a single logger call
+                    log_lines: list[str] = []
+                    # Blocks of one message arrive together, so share one timestamp
+                    message_time_ns = time.monotonic_ns()
+                    for block in message_content:
+                        kind = _block_kind(block)
+
                         # Thinking blocks (skip logging)
-                        if ThinkingBlock and isinstance(block, ThinkingBlock):
-                            thinking = block.thinking if hasattr(block, 'thinking') else str(block)
+                        if kind == "thinking":
+                            thinking = getattr(block, 'thinking', None) or str(block)
                             transcript.append(f"[thinking] {thinking}")
 
                         # Text blocks
-                        elif TextBlock and isinstance(block, TextBlock):
-                            logger.info(f"💬 {block.text}")
+                        elif kind == "text":
+                            if log_info:
+                                log_lines.append(f"💬 {block.text}")
                             transcript.append(block.text)
                             if not is_complete:
                                 final_answer = block.text
 
                         # Tool use blocks
-                        elif ToolUseBlock and isinstance(block, ToolUseBlock):
-                            tool_name = block.name if hasattr(block, 'name') else 'unknown'
-                            tool_input = block.input if hasattr(block, 'input') else {}
-
-                            # Calculate thinking time (time from last result/text to this tool call)
-                            current_time = time.time()
-                            thinking_duration = current_time - last_timestamp
-                            tool_call_start_time = current_time
+                        elif kind == "tool_use":
+                            tool_name = getattr(block, 'name', 'unknown')
+                            tool_input = getattr(block, 'input', {})
 
-                            # Log with truncation and timing
-                            tool_input_str = str(tool_input)
-                            if len(tool_input_str) > 500:
-                                tool_input_str = tool_input_str[:500] + "..."
+                            tool_call_start_ns = message_time_ns
 
-                            logger.info(f"🔧 [+{thinking_duration:.2f}s think] {tool_name}({tool_input_str})")
+                            # Log with truncation and thinking time (time from last result/text to this tool call)
+                            if log_info:
+                                thinking_duration = (message_time_ns - last_timestamp_ns) / 1e9
+                                tool_input_str = _TOOL_INPUT_REPR.repr(tool_input)
+                                log_lines.append(f"🔧 [+{thinking_duration:.2f}s think] {tool_name}({tool_input_str})")
                             transcript.append(f"[tool] {tool_name}: {tool_input}")
 
                         # Tool result blocks
-                        elif ToolResultBlock and isinstance(block, ToolResultBlock):
-                            is_error = block.is_error if hasattr(block, 'is_error') else False
-                            content = block.content if hasattr(block, 'content') else None
-
-                            # Calculate tool execution time
-                            current_time = time.time()
-                            if tool_call_start_time is not None:
-                                tool_execution_duration = current_time - tool_call_start_time
-                                timing_info = f"[⏱️ {tool_execution_duration:.2f}s exec] "
-                            else:
-                                timing_info = ""
-                            last_timestamp = current_time
+                        elif kind == "tool_result":
+                            is_error = getattr(block, 'is_error', False)
+                            content = getattr(block, 'content', None)
+
+                            # Tool execution time (formatted only when logged)
+                            exec_ns = (
+                                message_time_ns - tool_call_start_ns
+                                if tool_call_start_ns is not None else None
+                            )
+                            last_timestamp_ns = message_time_ns
 
                             # Convert content to string (handle MCP tool result format)
                             if isinstance(content, list):
-                                # Extract text from structured content blocks
+                                # Extract text from structured content blocks; image blocks
+                                # are not stringified (their base64 data is never logged)
                                 text_parts = []
                                 for item in content:
                                     if isinstance(item, dict) and 'text' in item:
                                         text_parts.append(item['text'])
+                                    elif isinstance(item, dict) and (item.get('type') == 'image' or 'source' in item):
+                                        text_parts.append("<image_omitted>")
                                     else:
                                         text_parts.append(str(item))
                                 content_str = " ".join(text_parts)
@@ -723,11 +1019,8 @@ class GboxClaudeAgent:
 
                             # Filter out image bytes to reduce log clutter
                             if "data:image" in content_str or "'data': 'iVBORw0KG" in content_str:
-                                # Replace image data with placeholder
-                                import re
-                                # Remove base64 image data
-                                content_str = re.sub(r"'data': '[A-Za-z0-9+/=]{100,}'", "'data': '<image_bytes_removed>'", content_str)
-                                content_str = re.sub(r'"data": "[A-Za-z0-9+/=]{100,}"', '"data": "<image_bytes_removed>"', content_str)
+                                # Replace base64 image data with placeholder
+                                content_str = _IMAGE_DATA_RE.sub(_IMAGE_DATA_REPLACEMENT, content_str)
 
                             # Check for task completion signal
                             if "TASK_COMPLETE:" in content_str:
@@ -737,62 +1030,102 @@ class GboxClaudeAgent:
                                 final_answer = answer_part.strip().rstrip('"}').rstrip('"').strip()
 
                                 # Unescape common escape sequences that Claude might include
-                                final_answer = final_answer.replace("\\'", "'")
-                                final_answer = final_answer.replace('\\"', '"')
-                                final_answer = final_answer.replace("\\\\", "\\")
+                                final_answer = _ANSWER_ESCAPE_RE.sub(lambda m: _ANSWER_ESCAPES[m.group()], final_answer)
 
                                 is_complete = True
-                                logger.info(f"✅ Task complete: {final_answer}")
+                                if log_info:
+                                    log_lines.append(f"✅ Task complete: {final_answer}")
                                 transcript.append(f"[complete] {final_answer}")
                                 continue
 
+                            if is_error or log_info:
+                                timing_info = f"[⏱️ {exec_ns / 1e9:.2f}s exec] " if exec_ns is not None else ""
+
                             if is_error:
-                                logger.error(f"❌ {timing_info}{content_str[:500]}")
+                                if log_lines:
+                                    logger.info("\n".join(log_lines))
+                                    log_lines.clear()
+                                logger.error("❌ %s%s", timing_info, content_str[:500])
                                 transcript.append(f"[error] {content_str}")
                             else:
                                 # Log with truncation (max 1000 chars)
-                                if len(content_str) > 1000:
-                                    logger.info(f"📥 {timing_info}Tool result: {content_str[:1000]}...")
-                                else:
-                                    logger.info(f"📥 {timing_info}Tool result: {content_str}")
+                                if log_info:
+                                    if len(content_str) > 1000:
+                                        log_lines.append(f"📥 {timing_info}Tool result: {content_str[:1000]}...")
+                                    else:
+                                        log_lines.append(f"📥 {timing_info}Tool result: {content_str}")
 
                                 transcript.append(f"[result] {content_str[:200]}")
 
+                    if log_lines:
+                        logger.info("\n".join(log_lines))
+
                 # Handle ResultMessage (session end)
                 elif isinstance(message, ResultMessage):
                     # Capture session ID for resuming
-                    if hasattr(message, 'session_id') and message.session_id:
-                        self._session_id = message.session_id
+                    session_id = getattr(message, 'session_id', None)
+                    if session_id:
+                        self._session_id = session_id
 
                     # Check if this was an error result
-                    if hasattr(message, 'is_error') and message.is_error:
-                        error_msg = str(message.result) if hasattr(message, 'result') else 'Unknown error'
+                    if getattr(message, 'is_error', False):
+                        error_msg = str(getattr(message, 'result', 'Unknown error'))
 
                         # Check for image processing error specifically
                         if "Could not process image" in error_msg:
                             has_image_error = True
-                            logger.error(f"🖼️ Image processing error: {error_msg[:200]}")
+                            logger.error("🖼️ Image processing error: %s", error_msg[:200])
                         else:
                             # Other errors (e.g., usage policy)
                             has_error = True
-                            logger.error(f"🚨 Session error: {error_msg[:200]}")
+                            logger.error("🚨 Session error: %s", error_msg[:200])
 
-                    num_turns = message.num_turns if hasattr(message, 'num_turns') else 0
-                    logger.info(f"📊 Session complete ({num_turns} turns)")
-                    break
+                    num_turns = getattr(message, 'num_turns', 0)
+                    logger.info("📊 Session complete (%s turns)", num_turns)
+        except BaseException:
+            # Drop the client on hard errors so the next step reconnects
+            await self._close_client()
+            raise
 
         return final_answer, transcript, is_complete, has_error, has_image_error
 
-    def reset(self, test_config_file: str) -> None:
+    def reset(self, test_config_file: str, preconnect: bool = True) -> None:
         """
         Reset agent for new task.
 
         Args:
             test_config_file: Path to task config JSON
+            preconnect: Connect the next session's client on the agent's
+                background loop now. Pass False when the task will be driven
+                with next_action_async from another event loop, which would
+                have to replace that client.
         """
+        self._close_client_sync()
         self._session_id = None
         self._completed = False
         self._final_answer = None
         self._step_count = 0
         self._image_error_count = 0  # Reset image error counter for new task
-        logger.info(f"Agent reset for config: {test_config_file}")
+        self._claude_options = self._create_task_options(test_config_file)
+        self._subagent_sections = self._prompt_sections(self._claude_options)
+        # Start the new session's client now, so its startup overlaps with the
+        # caller's environment reset instead of delaying the first step
+        if preconnect:
+            self._preconnect = asyncio.run_coroutine_threadsafe(
+                self._connect_client(unused=True), self._loop
+            )
+        logger.info("Agent reset for config: %s", test_config_file)
+
+    def close(self) -> None:
+        """Stop the background event loop and release its thread."""
+        if self._loop.is_closed():
+            return
+        self._close_client_sync()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+
+    def __del__(self) -> None:
+        loop = getattr(self, "_loop", None)
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
@@ -9,13 +9,23 @@ Default log directory: log_files/
 """
 
 import argparse
+import functools
 import json
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
 
+# The [Result] line is written near the end of a task log, so only the tail is read
+RESULT_TAIL_BYTES = 8192
 
-def get_task_type(task_id: int, config_dir: Path = Path('config_files')) -> str:
+TASK_ID_RE = re.compile(r'task_(\d+)_')
+
+CONFIG_DIR = Path('config_files')
+
+
+@functools.lru_cache(maxsize=None)
+def get_task_type(task_id: int, config_dir: Path = CONFIG_DIR) -> str:
     """
     Get the task type (shopping, map, gitlab, etc.) from config file.
 
@@ -62,11 +72,16 @@ def analyze_log_file(log_path: Path) -> str:
         'INCOMPLETE' if no result found
     """
     try:
-        content = log_path.read_text()
-
-        if '[Result] (PASS)' in content:
+        with log_path.open('rb') as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - RESULT_TAIL_BYTES))
+            tail = f.read()
+
+        # Markers are ASCII, so search the raw bytes without decoding
+        if b'[Result] (PASS)' in tail:
             return 'PASS'
-        elif '[Result] (FAIL)' in content:
+        elif b'[Result] (FAIL)' in tail:
             return 'FAIL'
         else:
             return 'INCOMPLETE'
@@ -77,7 +92,7 @@ def analyze_log_file(log_path: Path) -> str:
 
 def extract_task_id(filename: str) -> int:
     """Extract task ID from log filename."""
-    match = re.match(r'task_(\d+)_', filename)
+    match = TASK_ID_RE.match(filename)
     if match:
         return int(match.group(1))
     return -1
@@ -113,18 +128,24 @@ def main():
 
     print(f"🔍 Analyzing {len(log_files)} log files in {log_dir}/\n")
 
-    # Analyze each file
-    results = defaultdict(list)
-    task_type_counts = defaultdict(lambda: defaultdict(int))
+    # Analyze each file (per-task detail lists are only kept for --details)
+    status_counts: Counter[str] = Counter()
+    results = {'PASS': [], 'FAIL': [], 'INCOMPLETE': [], 'ERROR': []}
+    task_type_counts: Counter[tuple[str, str]] = Counter()
+
+    # Reading logs is I/O bound, so overlap the reads with a thread pool
+    with ThreadPoolExecutor(max_workers=min(32, len(log_files))) as executor:
+        statuses = list(executor.map(analyze_log_file, log_files))
 
-    for log_file in log_files:
-        status = analyze_log_file(log_file)
+    for log_file, status in zip(log_files, statuses):
         task_id = extract_task_id(log_file.name)
         task_type = get_task_type(task_id)
-        results[status].append((task_id, task_type, log_file.name))
+        status_counts[status] += 1
+        if args.details:
+            results[status].append((task_id, task_type, log_file.name))
 
         # Track counts by task type
-        task_type_counts[task_type][status] += 1
+        task_type_counts[(task_type, status)] += 1
 
     # Print summary
     print("=" * 70)
@@ -132,10 +153,10 @@ def main():
     print("=" * 70)
 
     total = len(log_files)
-    pass_count = len(results['PASS'])
-    fail_count = len(results['FAIL'])
-    incomplete_count = len(results['INCOMPLETE'])
-    error_count = len(results['ERROR'])
+    pass_count = status_counts['PASS']
+    fail_count = status_counts['FAIL']
+    incomplete_count = status_counts['INCOMPLETE']
+    error_count = status_counts['ERROR']
 
     print(f"✅ PASS:       {pass_count:4d} ({pass_count/total*100:5.1f}%)")
     print(f"❌ FAIL:       {fail_count:4d} ({fail_count/total*100:5.1f}%)")
@@ -160,12 +181,11 @@ def main():
         print("BREAKDOWN BY TASK TYPE")
         print("=" * 70)
 
-        for task_type in sorted(task_type_counts.keys()):
-            counts = task_type_counts[task_type]
-            total_type = sum(counts.values())
-            passed = counts.get('PASS', 0)
-            failed = counts.get('FAIL', 0)
-            incomplete = counts.get('INCOMPLETE', 0)
+        for task_type in sorted({task_type for task_type, _ in task_type_counts}):
+            passed = task_type_counts[(task_type, 'PASS')]
+            failed = task_type_counts[(task_type, 'FAIL')]
+            incomplete = task_type_counts[(task_type, 'INCOMPLETE')]
+            total_type = passed + failed + incomplete + task_type_counts[(task_type, 'ERROR')]
             completed_type = passed + failed
 
             success = (passed / completed_type * 100) if completed_type > 0 else 0
@@ -39,16 +39,14 @@ def is_expired(
     if not storage_state.exists():
         return True
 
-    context_manager = sync_playwright()
-    playwright = context_manager.__enter__()
-    browser = playwright.chromium.launch(headless=True, slow_mo=SLOW_MO)
-    context = browser.new_context(storage_state=storage_state)
-    page = context.new_page()
-    page.goto(url)
-    time.sleep(1)
-    d_url = page.url
-    content = page.content()
-    context_manager.__exit__()
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True, slow_mo=SLOW_MO)
+        context = browser.new_context(storage_state=storage_state)
+        page = context.new_page()
+        page.goto(url)
+        time.sleep(1)
+        d_url = page.url
+        content = page.content()
     if keyword:
         return keyword not in content
     else:
@@ -59,49 +57,46 @@ def is_expired(
 
 
 def renew_comb(comb: list[str], auth_folder: str = "./.auth") -> None:
-    context_manager = sync_playwright()
-    playwright = context_manager.__enter__()
-    browser = playwright.chromium.launch(headless=HEADLESS)
-    context = browser.new_context()
-    page = context.new_page()
-
-    if "shopping" in comb:
-        username = ACCOUNTS["shopping"]["username"]
-        password = ACCOUNTS["shopping"]["password"]
-        page.goto(f"{SHOPPING}/customer/account/login/")
-        page.get_by_label("Email", exact=True).fill(username)
-        page.get_by_label("Password", exact=True).fill(password)
-        page.get_by_role("button", name="Sign In").click()
-
-    if "reddit" in comb:
-        username = ACCOUNTS["reddit"]["username"]
-        password = ACCOUNTS["reddit"]["password"]
-        page.goto(f"{REDDIT}/login")
-        page.get_by_label("Username").fill(username)
-        page.get_by_label("Password").fill(password)
-        page.get_by_role("button", name="Log in").click()
-
-    if "shopping_admin" in comb:
-        username = ACCOUNTS["shopping_admin"]["username"]
-        password = ACCOUNTS["shopping_admin"]["password"]
-        page.goto(f"{SHOPPING_ADMIN}")
-        page.get_by_placeholder("user name").fill(username)
-        page.get_by_placeholder("password").fill(password)
-        page.get_by_role("button", name="Sign in").click()
-
-    if "gitlab" in comb:
-        username = ACCOUNTS["gitlab"]["username"]
-        password = ACCOUNTS["gitlab"]["password"]
-        page.goto(f"{GITLAB}/users/sign_in")
-        page.get_by_test_id("username-field").click()
-        page.get_by_test_id("username-field").fill(username)
-        page.get_by_test_id("username-field").press("Tab")
-        page.get_by_test_id("password-field").fill(password)
-        page.get_by_test_id("sign-in-button").click()
-
-    context.storage_state(path=f"{auth_folder}/{'.'.join(comb)}_state.json")
-
-    context_manager.__exit__()
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=HEADLESS)
+        context = browser.new_context()
+        page = context.new_page()
+
+        if "shopping" in comb:
+            username = ACCOUNTS["shopping"]["username"]
+            password = ACCOUNTS["shopping"]["password"]
+            page.goto(f"{SHOPPING}/customer/account/login/")
+            page.get_by_label("Email", exact=True).fill(username)
+            page.get_by_label("Password", exact=True).fill(password)
+            page.get_by_role("button", name="Sign In").click()
+
+        if "reddit" in comb:
+            username = ACCOUNTS["reddit"]["username"]
+            password = ACCOUNTS["reddit"]["password"]
+            page.goto(f"{REDDIT}/login")
+            page.get_by_label("Username").fill(username)
+            page.get_by_label("Password").fill(password)
+            page.get_by_role("button", name="Log in").click()
+
+        if "shopping_admin" in comb:
+            username = ACCOUNTS["shopping_admin"]["username"]
+            password = ACCOUNTS["shopping_admin"]["password"]
+            page.goto(f"{SHOPPING_ADMIN}")
+            page.get_by_placeholder("user name").fill(username)
+            page.get_by_placeholder("password").fill(password)
+            page.get_by_role("button", name="Sign in").click()
+
+        if "gitlab" in comb:
+            username = ACCOUNTS["gitlab"]["username"]
+            password = ACCOUNTS["gitlab"]["password"]
+            page.goto(f"{GITLAB}/users/sign_in")
+            page.get_by_test_id("username-field").click()
+            page.get_by_test_id("username-field").fill(username)
+            page.get_by_test_id("username-field").press("Tab")
+            page.get_by_test_id("password-field").fill(password)
+            page.get_by_test_id("sign-in-button").click()
+
+        context.storage_state(path=f"{auth_folder}/{'.'.join(comb)}_state.json")
 
 
 def get_site_comb_from_filepath(file_path: str) -> list[str]:
@@ -1,5 +1,9 @@
+import functools
 import json
+import logging
+import os
 import re
+import shutil
 import time
 from collections import defaultdict
 from dataclasses import dataclass
@@ -13,6 +17,8 @@ from beartype.door import is_bearable
 from gymnasium import Env
 from gymnasium.spaces import Box, Text
 from playwright.sync_api import (
+    Browser,
+    BrowserContext,
     CDPSession,
     Page,
     Playwright,
@@ -21,15 +27,24 @@ from playwright.sync_api import (
     sync_playwright,
 )
 
-from .actions import Action, execute_action, get_action_space
+try:
+    # Optional faster JSON parser for cookie-heavy task configs
+    import orjson
+except ImportError:
+    orjson = None
+
+from .actions import Action, ActionTypes, execute_action, get_action_space
 from .processors import ObservationHandler, ObservationMetadata
 from .utils import (
     AccessibilityTree,
     DetachedPage,
+    LazyDetachedPage,
     Observation,
     png_bytes_to_numpy,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class PlaywrightScript:
@@ -40,28 +55,99 @@ class PlaywrightScript:
     value: str | None = None  # avatar movie, Enter
 
 
+# Bumps window.__mutCount on anything that can change the observation:
+# every DOM mutation record, form input (not visible to MutationObserver),
+# focus, hover and scrolling (viewport-only observations depend on the scroll
+# offset). window.__docNonce is unique per document, so a reload or a
+# redirect back to the same URL never matches the previous document's count.
+PAGE_CHANGE_COUNTER_SCRIPT = """
+window.__mutCount = 0;
+window.__docNonce = performance.timeOrigin + ":" + Math.random();
+(() => {
+    const bump = () => { window.__mutCount++; };
+    new MutationObserver((records) => { window.__mutCount += records.length; }).observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true,
+    });
+    for (const type of ["input", "change", "focusin", "mouseover", "scroll", "resize"]) {
+        window.addEventListener(type, bump, true);
+    }
+})();
+"""
+
+PAGE_SIGNATURE_SCRIPT = "[window.__docNonce ?? null, window.__mutCount ?? -1]"
+
+# Actions that leave the page untouched, after which the previous observation
+# may be reused if the page signature still matches. Anything else can shift
+# layout (or change iframes) without a DOM mutation in the main frame, so its
+# observation is always extracted again.
+OBS_REUSE_ACTION_TYPES = frozenset({ActionTypes.NONE, ActionTypes.STOP})
+
+# Per-origin storage in a Chromium profile directory. These are wiped before
+# each persistent context is launched, so only the HTTP, code and GPU caches
+# carry over between episodes.
+PROFILE_STORAGE_DIRS = (
+    "Local Storage",
+    "Session Storage",
+    "IndexedDB",
+    "Service Worker",
+    "File System",
+    "WebStorage",
+    "databases",
+)
+
+# Sets one origin's localStorage items from a storage_state "origins" entry
+RESTORE_LOCAL_STORAGE_SCRIPT = """(items) => {
+    for (const { name, value } of items) localStorage.setItem(name, value);
+}"""
+
+
+# Separates the tabs of a multi-page start_url, e.g. "url1 |AND| url2"
+START_URL_SEP = re.compile(r"\s*\|AND\|\s*")
+
+ACTION_RE = re.compile(
+    r"goto (?P<url>[^ ]+)"
+    r"|get_by_role (?P<destination>[^ ]+) (?P<name>[^ ]+) (?P<operation>[^ ]+)"
+    r"(?: (?P<value>[^ ]+))?"
+)
+
+
+# Shared by every env that skips observation extraction; treat as read-only
+SKIPPED_OBS_METADATA: dict[str, ObservationMetadata] = {
+    "text": {"obs_nodes_info": {}},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _blank_image(height: int, width: int) -> npt.NDArray[np.uint8]:
+    """Read-only black frame used as the image of skipped observations"""
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image.flags.writeable = False
+    return image
+
+
+@functools.lru_cache(maxsize=32)
+def _load_instance_config(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a task config (or storage state) once per file version; callers
+    must not mutate the returned dict. mtime_ns is only part of the cache key."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
 def parse_action(action: str) -> PlaywrightScript:
-    splitted = action.strip().split(" ")
-    assert len(splitted) >= 2
-    match splitted[:2]:
-        case ["goto", url]:
-            assert len(splitted) == 2
-            return PlaywrightScript("goto", url)
-        case ["get_by_role", destination]:
-            assert len(splitted) >= 4
-            match splitted[2:]:
-                case [name, operation]:
-                    return PlaywrightScript(
-                        "get_by_role", destination, name, operation
-                    )
-                case [name, operation, value]:
-                    return PlaywrightScript(
-                        "get_by_role", destination, name, operation, value
-                    )
-                case _:
-                    raise ValueError("Invalid action")
-        case _:
-            raise ValueError(f"Invalid action {action}")
+    match = ACTION_RE.fullmatch(action.strip())
+    if match is None:
+        raise ValueError(f"Invalid action {action}")
+    url = match.group("url")
+    if url is not None:
+        return PlaywrightScript("goto", url)
+    return PlaywrightScript(
+        "get_by_role",
+        match.group("destination"),
+        match.group("name"),
+        match.group("operation"),
+        match.group("value"),
+    )
 
 
 class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
@@ -83,9 +169,11 @@ class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
         current_viewport_only: bool = False,
         viewport_size: ViewportSize = {"width": 1280, "height": 720},
         save_trace_enabled: bool = False,
+        trace_snapshots: bool = True,
         sleep_after_execution: float = 0.0,
         cdp_url: str | None = None,
         skip_observation_extraction: bool = False,
+        user_data_dir: str | None = None,
     ):
         # TODO: make Space[Action] = ActionSpace
         self.action_space = get_action_space()  # type: ignore[assignment]
@@ -95,9 +183,31 @@ class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
         self.reset_finished = False
         self.viewport_size = viewport_size
         self.save_trace_enabled = save_trace_enabled
+        # DOM snapshots make up most of a trace; screenshots are always kept
+        self.trace_snapshots = trace_snapshots
         self.sleep_after_execution = sleep_after_execution
         self.cdp_url = cdp_url
         self.skip_observation_extraction = skip_observation_extraction
+        # Launch the local browser with a persistent profile so its on-disk
+        # caches survive resets; not used when connecting over CDP
+        self.user_data_dir = None if cdp_url else user_data_dir
+        self.context_manager: Any = None
+        self.playwright: Playwright | None = None
+        self.browser: Browser | None = None
+        self.context: BrowserContext | None = None
+        self._obs_cache: tuple[
+            dict[str, Observation], dict[str, ObservationMetadata]
+        ] | None = None
+        self._obs_sig: tuple[Any, ...] | None = None
+        # Bumped whenever the page may change (steps, resets, close), so the
+        # lazy info["page"] of an earlier step can tell it is out of date
+        self._page_version = 0
+        self._blank_obs: dict[str, Observation] = {
+            "text": "[Observation skipped - using visual GBOX agent]",
+            "image": _blank_image(
+                viewport_size["height"], viewport_size["width"]
+            ),
+        }
 
         match observation_type:
             case "html" | "accessibility_tree":
@@ -125,139 +235,252 @@ class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
             self.observation_handler.get_observation_space()
         )
 
-    @beartype
-    def setup(self, config_file: Path | None = None) -> None:
-        print(f"[SETUP] Starting setup, config_file={config_file}")
-        self.context_manager = sync_playwright()
-        self.playwright = self.context_manager.__enter__()
-        print(f"[SETUP] Playwright initialized")
+    def _ensure_browser(self) -> None:
+        """Start Playwright and the browser on first use. Both are kept
+        alive across resets; only the browser context is per episode."""
+        if self.browser is not None and self.browser.is_connected():
+            return
+
+        if self.context_manager is None:
+            self.context_manager = sync_playwright()
+            self.playwright = self.context_manager.__enter__()
+            logger.debug("[SETUP] Playwright initialized")
+
+        if self.user_data_dir:
+            # the browser is launched together with each persistent context
+            return
 
         if self.cdp_url:
-            print(f"[SETUP] Connecting to browser via CDP: {self.cdp_url}")
+            logger.debug("[SETUP] Connecting to browser via CDP: %s", self.cdp_url)
             self.browser = self.playwright.chromium.connect_over_cdp(self.cdp_url)
-            print(f"[SETUP] ✅ Connected to browser successfully")
+            logger.debug("[SETUP] ✅ Connected to browser successfully")
         else:
-            print(f"[SETUP] Launching browser with headless={self.headless}, slow_mo={self.slow_mo}")
-            launch_args = {
-                "headless": self.headless,
-                "slow_mo": self.slow_mo,
-            }
-            if not self.headless:
-                launch_args["args"] = ["--start-maximized"]
-                print(f"[SETUP] Added --start-maximized flag, launching visible browser")
-            self.browser = self.playwright.chromium.launch(**launch_args)
-            print(f"[SETUP] ✅ Browser launched successfully")
-
-        print(f"[SETUP] Reading config file...")
+            logger.debug("[SETUP] Launching browser with headless=%s, slow_mo=%s", self.headless, self.slow_mo)
+            self.browser = self.playwright.chromium.launch(**self._launch_args())
+            logger.debug("[SETUP] ✅ Browser launched successfully")
+
+    def _launch_args(self) -> dict[str, Any]:
+        launch_args: dict[str, Any] = {
+            "headless": self.headless,
+            "slow_mo": self.slow_mo,
+        }
+        if not self.headless:
+            launch_args["args"] = ["--start-maximized"]
+            logger.debug("[SETUP] Added --start-maximized flag, launching visible browser")
+        return launch_args
+
+    def _new_persistent_context(
+        self,
+        storage_state: str | dict[str, Any] | None,
+        geolocation: dict[str, float] | None,
+    ) -> BrowserContext:
+        # the previous browser has exited with its context, so its storage
+        # can be removed while the caches next to it stay
+        profile_dir = os.path.join(self.user_data_dir, "Default")
+        for name in PROFILE_STORAGE_DIRS:
+            shutil.rmtree(os.path.join(profile_dir, name), ignore_errors=True)
+
+        logger.debug("[SETUP] Launching browser with profile %s", self.user_data_dir)
+        context = self.playwright.chromium.launch_persistent_context(
+            self.user_data_dir,
+            **self._launch_args(),
+            viewport=self.viewport_size,
+            geolocation=geolocation,
+            device_scale_factor=1,
+        )
+        # drop the blank tab the browser starts with
+        for page in context.pages:
+            page.close()
+
+        # persistent contexts take no storage_state, so restore it by hand:
+        # cookies directly, localStorage the way new_context does it, from a
+        # page whose requests never leave the browser
+        context.clear_cookies()
+        if not storage_state:
+            return context
+        if not isinstance(storage_state, dict):
+            storage_state = _load_instance_config(
+                str(storage_state), os.stat(storage_state).st_mtime_ns
+            )
+        context.add_cookies(storage_state.get("cookies", []))
+        origins = storage_state.get("origins") or []
+        if origins:
+            page = context.new_page()
+            page.route(
+                "**/*",
+                lambda route: route.fulfill(body="<html></html>", content_type="text/html"),
+            )
+            for origin in origins:
+                page.goto(origin["origin"])
+                page.evaluate(
+                    RESTORE_LOCAL_STORAGE_SCRIPT, origin.get("localStorage", [])
+                )
+            page.close()
+        return context
+
+    def _close_context(self) -> None:
+        self._page_version += 1
+        if self.context is None:
+            return
+        try:
+            self.context.close()
+        except Exception as e:
+            logger.warning("Failed to close browser context: %s", e)
+        self.context = None
+
+    def setup(self, config_file: Path | None = None) -> None:
+        logger.debug("[SETUP] Starting setup, config_file=%s", config_file)
+        self._ensure_browser()
+
+        logger.debug("[SETUP] Reading config file...")
         if config_file:
-            with open(config_file, "r") as f:
-                instance_config = json.load(f)
+            instance_config = _load_instance_config(
+                str(config_file), config_file.stat().st_mtime_ns
+            )
         else:
             instance_config = {}
 
         storage_state = instance_config.get("storage_state", None)
         start_url = instance_config.get("start_url", None)
         geolocation = instance_config.get("geolocation", None)
-        print(f"[SETUP] Config loaded: start_url={start_url}, has_storage={bool(storage_state)}")
+        logger.debug("[SETUP] Config loaded: start_url=%s, has_storage=%s", start_url, bool(storage_state))
 
-        print(f"[SETUP] Creating browser context...")
-        self.context = self.browser.new_context(
-            viewport=self.viewport_size,
-            storage_state=storage_state,
-            geolocation=geolocation,
-            device_scale_factor=1,
-        )
-        print(f"[SETUP] ✅ Browser context created")
+        logger.debug("[SETUP] Creating browser context...")
+        if self.user_data_dir:
+            self.context = self._new_persistent_context(storage_state, geolocation)
+        else:
+            self.context = self.browser.new_context(
+                viewport=self.viewport_size,
+                storage_state=storage_state,
+                geolocation=geolocation,
+                device_scale_factor=1,
+            )
+        logger.debug("[SETUP] ✅ Browser context created")
+        if not self.skip_observation_extraction:
+            # only the observation reuse check reads the counter
+            self.context.add_init_script(PAGE_CHANGE_COUNTER_SCRIPT)
+        self._obs_cache = None
+        self._obs_sig = None
         if self.save_trace_enabled:
-            print(f"[SETUP] Starting trace...")
-            self.context.tracing.start(screenshots=True, snapshots=True)
+            logger.debug("[SETUP] Starting trace...")
+            self.context.tracing.start(
+                screenshots=True, snapshots=self.trace_snapshots
+            )
 
-        if start_url:
-            start_urls = start_url.split(" |AND| ")
-            print(f"[SETUP] Will navigate to {len(start_urls)} URL(s)")
+        start_urls = [url for url in START_URL_SEP.split((start_url or "").strip()) if url]
+        if start_urls:
+            logger.debug("[SETUP] Will navigate to %d URL(s)", len(start_urls))
+            nav_start = time.monotonic()
+            # Sync pages cannot await navigations concurrently, so only wait for
+            # each navigation to commit here and let the pages keep loading in
+            # the browser while the next one is started
+            navigations = []
             for i, url in enumerate(start_urls, 1):
-                print(f"[SETUP] [{i}/{len(start_urls)}] Creating new page...")
+                logger.debug("[SETUP] [%d/%d] Creating new page...", i, len(start_urls))
                 page = self.context.new_page()
-                print(f"[SETUP] [{i}/{len(start_urls)}] ✅ Page created")
-
-                print(f"[SETUP] [{i}/{len(start_urls)}] Creating CDP session...")
-                client = page.context.new_cdp_session(page)
-                print(f"[SETUP] [{i}/{len(start_urls)}] ✅ CDP session created")
+                logger.debug("[SETUP] [%d/%d] ✅ Page created", i, len(start_urls))
 
-                if self.text_observation_type == "accessibility_tree":
-                    print(f"[SETUP] [{i}/{len(start_urls)}] Enabling accessibility...")
-                    client.send("Accessibility.enable")
-                    print(f"[SETUP] [{i}/{len(start_urls)}] ✅ Accessibility enabled")
+                logger.debug("[SETUP] [%d/%d] 🌐 Navigating to: %s", i, len(start_urls), url)
+                try:
+                    page.goto(url, timeout=10000, wait_until='commit')
+                    navigations.append((i, page))
+                except Exception as e:
+                    nav_time = time.monotonic() - nav_start
+                    logger.warning("[SETUP] [%d/%d] ❌ Navigation failed (%.1fs): %s", i, len(start_urls), nav_time, e)
 
-                page.client = client  # type: ignore
+                # CDP sessions survive navigations, so set this one up while
+                # the page is still loading instead of before navigating
+                self._attach_cdp_session(page)
 
-                print(f"[SETUP] [{i}/{len(start_urls)}] 🌐 Navigating to: {url}")
-                import time
-                nav_start = time.time()
+            for i, page in navigations:
                 try:
-                    page.goto(url, timeout=10000, wait_until='domcontentloaded')
-                    nav_time = time.time() - nav_start
-                    print(f"[SETUP] [{i}/{len(start_urls)}] ✅ Navigation complete ({nav_time:.1f}s)")
+                    page.wait_for_load_state('domcontentloaded', timeout=10000)
+                    nav_time = time.monotonic() - nav_start
+                    logger.debug("[SETUP] [%d/%d] ✅ Navigation complete (%.1fs)", i, len(start_urls), nav_time)
                 except Exception as e:
-                    nav_time = time.time() - nav_start
-                    print(f"[SETUP] [{i}/{len(start_urls)}] ❌ Navigation failed ({nav_time:.1f}s): {e}")
+                    nav_time = time.monotonic() - nav_start
+                    logger.warning("[SETUP] [%d/%d] ❌ Navigation failed (%.1fs): %s", i, len(start_urls), nav_time, e)
 
             # set the first page as the current page
-            print(f"[SETUP] Setting first page as active...")
+            logger.debug("[SETUP] Setting first page as active...")
             self.page = self.context.pages[0]
             self.page.bring_to_front()
-            print(f"[SETUP] ✅ Page activated")
+            logger.debug("[SETUP] ✅ Page activated")
         else:
-            print(f"[SETUP] No start URL, creating blank page...")
+            logger.debug("[SETUP] No start URL, creating blank page...")
             self.page = self.context.new_page()
-            client = self.page.context.new_cdp_session(self.page)
-            if self.text_observation_type == "accessibility_tree":
-                client.send("Accessibility.enable")
-            self.page.client = client  # type: ignore
+            self._attach_cdp_session(self.page)
             self.page.goto("about:blank", timeout=5000)
-            print(f"[SETUP] ✅ Blank page created")
+            logger.debug("[SETUP] ✅ Blank page created")
 
-        print(f"[SETUP] ✅✅✅ Setup complete!")
+        logger.debug("[SETUP] ✅✅✅ Setup complete!")
+
+    def _attach_cdp_session(self, page: Page) -> None:
+        if self.skip_observation_extraction or not self.observation_handler.needs_cdp:
+            # evaluators accept a missing client, nothing else uses it
+            page.client = None  # type: ignore
+            return
+        client = page.context.new_cdp_session(page)
+        if self.text_observation_type == "accessibility_tree":
+            client.send("Accessibility.enable")
+        page.client = client  # type: ignore
+        logger.debug("[SETUP] ✅ CDP session attached")
 
     def get_page_client(self, page: Page) -> CDPSession:
         return page.client  # type: ignore
 
-    def _get_obs(self) -> dict[str, Observation]:
+    def _page_signature(self) -> tuple[Any, ...] | None:
+        """Cheap fingerprint of the current page, None if it cannot be trusted"""
+        try:
+            doc_nonce, mut_count = self.page.evaluate(PAGE_SIGNATURE_SCRIPT)
+        except Exception:
+            return None
+        if doc_nonce is None or mut_count < 0:
+            # the change counter was not injected (e.g. initial about:blank)
+            return None
+        return (
+            id(self.page),
+            self.page.url,
+            len(self.context.pages),
+            len(self.page.frames),
+            doc_nonce,
+            mut_count,
+        )
+
+    def _get_obs_and_metadata(
+        self, allow_reuse: bool = False
+    ) -> tuple[dict[str, Observation], dict[str, ObservationMetadata]]:
+        """Extract the observation, or with allow_reuse return the previous
+        one when the page signature shows nothing has changed since"""
         if self.skip_observation_extraction:
-            print(f"[OBS] ⚡ Skipping observation extraction (visual agent mode)")
-            # Return minimal placeholder for visual agents using GBOX
-            return {
-                "text": "[Observation skipped - using visual GBOX agent]",
-                "image": np.zeros((self.viewport_size["height"], self.viewport_size["width"], 3), dtype=np.uint8),
-            }
-
-        print(f"[OBS] Getting observation from page...")
-        import time
-        obs_start = time.time()
-        obs = self.observation_handler.get_observation(
+            logger.debug("[OBS] ⚡ Skipping observation extraction (visual agent mode)")
+            # Return minimal placeholders for visual agents using GBOX
+            return self._blank_obs, SKIPPED_OBS_METADATA
+
+        sig = self._page_signature()
+        if allow_reuse and sig is not None and sig == self._obs_sig and self._obs_cache:
+            logger.debug("[OBS] ⚡ Page unchanged, reusing previous observation")
+            return self._obs_cache
+
+        logger.debug("[OBS] Getting observation and metadata from page...")
+        obs_start = time.monotonic()
+        obs_and_metadata = self.observation_handler.get_observation_and_metadata(
             self.page, self.get_page_client(self.page)
         )
-        obs_time = time.time() - obs_start
-        print(f"[OBS] ✅ Observation received ({obs_time:.1f}s)")
-        return obs
+        obs_time = time.monotonic() - obs_start
+        logger.debug("[OBS] ✅ Observation received (%.1fs)", obs_time)
+        self._obs_cache = obs_and_metadata
+        self._obs_sig = sig
+        return obs_and_metadata
+
+    def _get_obs(self) -> dict[str, Observation]:
+        return self._get_obs_and_metadata()[0]
 
     def _get_obs_metadata(self) -> dict[str, ObservationMetadata]:
         if self.skip_observation_extraction:
-            print(f"[OBS] ⚡ Skipping observation metadata (visual agent mode)")
-            # Return minimal placeholder metadata
-            return {
-                "text": {"obs_nodes_info": {}},
-            }
-
-        print(f"[OBS] Getting observation metadata...")
-        import time
-        meta_start = time.time()
-        metadata = self.observation_handler.get_observation_metadata()
-        meta_time = time.time() - meta_start
-        print(f"[OBS] ✅ Metadata received ({meta_time:.1f}s)")
-        return metadata
+            return SKIPPED_OBS_METADATA
+        return self.observation_handler.get_observation_metadata()
 
-    @beartype
     def reset(
         self,
         *,
@@ -269,39 +492,35 @@ class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
         :param options: options for the environment. The current supported options are:
             - "storage_state": the storage state of the browser. It is a file path to a json file.
         """
-        print(f"[RESET] Starting reset...")
+        logger.debug("[RESET] Starting reset...")
         super().reset(seed=seed, options=options)
 
         if self.reset_finished:
-            print(f"[RESET] Cleaning up previous context...")
-            self.context_manager.__exit__()
+            logger.debug("[RESET] Cleaning up previous context...")
+            self._close_context()
 
         if options is not None and "config_file" in options:
             config_file = Path(options["config_file"])
             if config_file.exists():
-                print(f"[RESET] Calling setup with config...")
+                logger.debug("[RESET] Calling setup with config...")
                 self.setup(config_file=config_file)
-                print(f"[RESET] ✅ Setup returned")
+                logger.debug("[RESET] ✅ Setup returned")
             else:
                 raise ValueError(f"Config file {config_file} does not exist.")
         else:
-            print(f"[RESET] Calling setup without config...")
+            logger.debug("[RESET] Calling setup without config...")
             self.setup()
-            print(f"[RESET] ✅ Setup returned")
+            logger.debug("[RESET] ✅ Setup returned")
 
         self.reset_finished = True
 
         if self.sleep_after_execution > 0:
-            print(f"[RESET] Sleeping {self.sleep_after_execution}s...")
+            logger.debug("[RESET] Sleeping %ss...", self.sleep_after_execution)
             time.sleep(self.sleep_after_execution)
 
-        print(f"[RESET] Getting observation...")
-        observation = self._get_obs()
-        print(f"[RESET] ✅ Observation received")
-
-        print(f"[RESET] Getting observation metadata...")
-        observation_metadata = self._get_obs_metadata()
-        print(f"[RESET] ✅ Metadata received")
+        logger.debug("[RESET] Getting observation...")
+        observation, observation_metadata = self._get_obs_and_metadata()
+        logger.debug("[RESET] ✅ Observation received")
 
         info = {
             "page": DetachedPage(self.page.url, ""),
@@ -309,7 +528,7 @@ class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
             "observation_metadata": observation_metadata,
         }
 
-        print(f"[RESET] ✅✅✅ Reset complete! Returning observation...")
+        logger.debug("[RESET] ✅✅✅ Reset complete! Returning observation...")
         return (observation, info)
 
     def save_trace(self, trace_path: str | Path) -> None:
@@ -317,8 +536,17 @@ class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
             self.context.tracing.stop(path=trace_path)
 
     def close(self) -> None:
-        if self.reset_finished:
+        self._close_context()
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception as e:
+                logger.warning("Failed to close browser: %s", e)
+            self.browser = None
+        if self.context_manager is not None:
             self.context_manager.__exit__()
+            self.context_manager = None
+            self.playwright = None
 
     def step(
         self, action: Action
@@ -328,6 +556,7 @@ class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
 
         success = False
         fail_error = ""
+        self._page_version += 1
         try:
             self.page = execute_action(
                 action,
@@ -343,11 +572,17 @@ class ScriptBrowserEnv(Env[dict[str, Observation], Action]):
         if self.sleep_after_execution > 0:
             time.sleep(self.sleep_after_execution)
 
-        observation = self._get_obs()
-        observation_metadata = self._get_obs_metadata()
+        observation, observation_metadata = self._get_obs_and_metadata(
+            allow_reuse=success and action["action_type"] in OBS_REUSE_ACTION_TYPES
+        )
 
         info = {
-            "page": DetachedPage(self.page.url, self.page.content()),
+            "page": LazyDetachedPage(
+                self.page.url,
+                self.page,
+                self._page_version,
+                lambda: self._page_version,
+            ),
             "fail_error": fail_error,
             "observation_metadata": observation_metadata,
         }
@@ -125,6 +125,10 @@ class RenderHelper(object):
             task_id = _config["task_id"]
 
         self.action_set_tag = action_set_tag
+        # last screenshot and its encoding; unchanged or skipped observations
+        # hand over the same array again
+        self._last_image: Any = None
+        self._last_image_str = ""
 
         self.render_file = open(
             Path(result_dir) / f"render_{task_id}.html", "a+"
@@ -154,12 +158,15 @@ class RenderHelper(object):
         if render_screenshot:
             # image observation
             img_obs = observation["image"]
-            image = Image.fromarray(img_obs)  # type:ignore
-            byte_io = io.BytesIO()
-            image.save(byte_io, format="PNG")
-            byte_io.seek(0)
-            image_bytes = base64.b64encode(byte_io.read())
-            image_str = image_bytes.decode("utf-8")
+            if img_obs is not self._last_image:
+                image = Image.fromarray(img_obs)  # type:ignore
+                byte_io = io.BytesIO()
+                image.save(byte_io, format="PNG")
+                byte_io.seek(0)
+                image_bytes = base64.b64encode(byte_io.read())
+                self._last_image = img_obs
+                self._last_image_str = image_bytes.decode("utf-8")
+            image_str = self._last_image_str
             new_content += f"<img src='data:image/png;base64,{image_str}' style='width:50vw; height:auto;'/>\n"
 
         # meta data
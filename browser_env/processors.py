@@ -171,6 +171,31 @@ class TextObervationProcessor(ObservationProcessor):
         ratio = overlap_width * overlap_height / width * height
         return ratio
 
+    @staticmethod
+    def get_in_viewport_mask(
+        bounds: list[list[float] | None], config: BrowserConfig
+    ) -> npt.NDArray[np.bool_]:
+        """Vectorized version of the per-node viewport filter: True for nodes
+        with a non-empty bound whose in-viewport ratio (as computed by
+        get_element_in_viewport_ratio) reaches IN_VIEWPORT_RATIO_THRESHOLD"""
+        has_bound = np.array([bool(bound) for bound in bounds], dtype=bool)
+        rects = np.array(
+            [bound if bound else (0.0, 0.0, 0.0, 0.0) for bound in bounds],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        x, y, width, height = rects.T
+
+        overlap_width = np.maximum(
+            0, np.minimum(x + width, config["win_width"]) - np.maximum(x, 0)
+        )
+        overlap_height = np.maximum(
+            0, np.minimum(y + height, config["win_height"]) - np.maximum(y, 0)
+        )
+        visible = has_bound & (width != 0) & (height != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = overlap_width * overlap_height / width * height
+        return visible & (ratio >= IN_VIEWPORT_RATIO_THRESHOLD)
+
     def fetch_page_html(
         self,
         info: BrowserInfo,
@@ -285,28 +310,11 @@ class TextObervationProcessor(ObservationProcessor):
                 # mark as removed
                 dom_tree[int(node_id)]["parentId"] = "[REMOVED]"
 
-            config = info["config"]
-            for cursor, node in enumerate(dom_tree):
-                if not node["union_bound"]:
-                    remove_node_in_graph(node)
-                    continue
-
-                [x, y, width, height] = node["union_bound"]
-
-                # invisible node
-                if width == 0.0 or height == 0.0:
-                    remove_node_in_graph(node)
-                    continue
-
-                in_viewport_ratio = self.get_element_in_viewport_ratio(
-                    elem_left_bound=float(x),
-                    elem_top_bound=float(y),
-                    width=float(width),
-                    height=float(height),
-                    config=config,
-                )
-
-                if in_viewport_ratio < IN_VIEWPORT_RATIO_THRESHOLD:
+            in_viewport = self.get_in_viewport_mask(
+                [node["union_bound"] for node in dom_tree], info["config"]
+            )
+            for node, keep in zip(dom_tree, in_viewport):
+                if not keep:
                     remove_node_in_graph(node)
 
             dom_tree = [
@@ -438,28 +446,12 @@ class TextObervationProcessor(ObservationProcessor):
                 # mark as removed
                 accessibility_tree[node_cursor]["parentId"] = "[REMOVED]"
 
-            config = info["config"]
-            for node in accessibility_tree:
-                if not node["union_bound"]:
-                    remove_node_in_graph(node)
-                    continue
-
-                [x, y, width, height] = node["union_bound"]
-
-                # invisible node
-                if width == 0 or height == 0:
-                    remove_node_in_graph(node)
-                    continue
-
-                in_viewport_ratio = self.get_element_in_viewport_ratio(
-                    elem_left_bound=float(x),
-                    elem_top_bound=float(y),
-                    width=float(width),
-                    height=float(height),
-                    config=config,
-                )
-
-                if in_viewport_ratio < IN_VIEWPORT_RATIO_THRESHOLD:
+            in_viewport = self.get_in_viewport_mask(
+                [node["union_bound"] for node in accessibility_tree],
+                info["config"],
+            )
+            for node, keep in zip(accessibility_tree, in_viewport):
+                if not keep:
                     remove_node_in_graph(node)
 
             accessibility_tree = [
@@ -715,12 +707,28 @@ class ObservationHandler:
         image_obs = self.image_processor.process(page, client)
         return {"text": text_obs, "image": image_obs}
 
+    def get_observation_and_metadata(
+        self, page: Page, client: CDPSession
+    ) -> tuple[dict[str, Observation], dict[str, ObservationMetadata]]:
+        """Process the page once and return the observation with the metadata
+        the processors recorded while building it"""
+        return (
+            self.get_observation(page, client),
+            self.get_observation_metadata(),
+        )
+
     def get_observation_metadata(self) -> dict[str, ObservationMetadata]:
         return {
             "text": self.text_processor.meta_data,
             "image": self.image_processor.meta_data,
         }
 
+    @property
+    def needs_cdp(self) -> bool:
+        """Whether observations need a CDP session; only the text processor
+        queries the browser through one, screenshots go through the page"""
+        return bool(self.text_processor.observation_type)
+
     @property
     def action_processor(self) -> ObservationProcessor:
         """Return the main processor that is associated with the action space"""
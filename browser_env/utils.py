@@ -1,10 +1,12 @@
+import threading
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Any, Dict, TypedDict, Union
+from typing import Any, Callable, Dict, TypedDict, Union
 
 import numpy as np
 import numpy.typing as npt
 from PIL import Image
+from playwright.sync_api import Page
 
 
 @dataclass
@@ -13,6 +15,48 @@ class DetachedPage:
     content: str  # html
 
 
+class LazyDetachedPage(DetachedPage):
+    """DetachedPage that serializes the html only when content is first read.
+
+    version is the env's page version at the step that made it, and
+    page_version returns the current one. Reading content after the env has
+    moved on (another step, a reset or close), or from another thread,
+    raises instead of returning some other document's html."""
+
+    def __init__(
+        self, url: str, page: Page, version: int, page_version: Callable[[], int]
+    ) -> None:
+        self.url = url
+        self._page: Page | None = page
+        self._version = version
+        self._page_version: Callable[[], int] | None = page_version
+        self._thread = threading.get_ident()
+        self._content: str | None = None
+
+    @property  # type: ignore[override]
+    def content(self) -> str:
+        if self._content is None:
+            assert self._page is not None and self._page_version is not None
+            if self._page_version() != self._version:
+                raise RuntimeError(
+                    "Page content was not read before the environment moved on"
+                )
+            if threading.get_ident() != self._thread:
+                raise RuntimeError(
+                    "Page content must be read on the thread that stepped the environment"
+                )
+            self._content = self._page.content()
+            self._page = None
+            self._page_version = None
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._page = None
+        self._page_version = None
+
+
 def png_bytes_to_numpy(png: bytes) -> npt.NDArray[np.uint8]:
     """Convert png bytes to numpy array
 
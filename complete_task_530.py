@@ -1,6 +1,5 @@
 """Complete task 530 - Draft refund message in contact form"""
-import time
-from gbox_sdk import GboxSDK
+from gbox_utils import open_task_browser, sdk
 
 # Configuration
 BOX_ID = "4e8e5ce1-fcb0-4e6b-963f-57492bfe99f1"
@@ -17,41 +16,27 @@ MESSAGE = f"""I would like to request a refund for order {ORDER_ID}. I purchased
 
 Thank you."""
 
+STEPS = f"""📋 Navigate to: {CONTACT_URL}
+📝 Fill in the contact form with:
+   Name: Emma Lopez
+   Email: emma.lopez@gmail.com
+   Message:
+   {MESSAGE}
+
+⚠️  DO NOT SUBMIT the form!"""
+
 print("Starting GBOX browser session...")
-gbox = GboxSDK()
 
 try:
-    # Open browser
-    print(f"Opening browser in box {BOX_ID}...")
-    result = gbox.client.v1.boxes.browser.open(
-        box_id=BOX_ID,
-        show_controls=True
-    )
-    print(f"Browser opened successfully!")
-    print(f"\n{'='*80}")
-    print("TASK 530: Draft Refund Message")
-    print(f"{'='*80}")
-    print(f"📋 Navigate to: {CONTACT_URL}")
-    print(f"📝 Fill in the contact form with:")
-    print(f"   Name: Emma Lopez")
-    print(f"   Email: emma.lopez@gmail.com")
-    print(f"   Message:")
-    print(f"   {MESSAGE}")
-    print(f"\n⚠️  DO NOT SUBMIT the form!")
-    print(f"{'='*80}")
-    print("\nBrowser is now open. Complete the task manually, then press ENTER...")
-    input()
-    
-    print("\n✅ Task completed. Closing browser...")
-    
-except Exception as e:
-    print(f"❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
-
+    if open_task_browser(
+        BOX_ID, "TASK 530: Draft Refund Message", STEPS, resolution=None,
+    ):
+        print("\nBrowser is now open. Complete the task manually, then press ENTER...")
+        input()
+        print("\n✅ Task completed. Closing browser...")
 finally:
     try:
-        gbox.client.v1.boxes.browser.close(box_id=BOX_ID)
+        sdk().client.v1.boxes.browser.close(box_id=BOX_ID)
         print("Browser closed.")
     except:
         pass
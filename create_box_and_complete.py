@@ -1,5 +1,5 @@
 """Create new box and complete task 530"""
-from gbox_sdk import GboxSDK
+from gbox_utils import open_task_browser, sdk
 
 SHOPPING_URL = "http://ec2-3-149-78-74.us-east-2.compute.amazonaws.com:7770"
 CONTACT_URL = f"{SHOPPING_URL}/contact/"
@@ -10,48 +10,24 @@ MESSAGE = f"""I would like to request a refund for order {ORDER_ID}. I purchased
 
 Thank you."""
 
+STEPS = f"""\n📋 Steps to complete:
+   1. In the GBOX browser, navigate to: {CONTACT_URL}
+   2. If not logged in, login with:
+      Email: emma.lopez@gmail.com
+      Password: Password.123
+   3. Fill in the contact form:
+      Name: Emma Lopez
+      Email: emma.lopez@gmail.com
+      Message (in 'What's on your mind?' textarea):"""
+
 print("Creating new GBOX (Linux type)...")
-gbox = GboxSDK()
-box = gbox.create(type="linux")
+box = sdk().create(type="linux")
 print(f"✅ Box created: {box.id}")
 print(f"   Update gbox_run.py DEFAULT_BOX_ID to: {box.id}")
 
-try:
-    # Set resolution
-    print("\nSetting resolution to 1920x1080...")
-    box.resolution.set(width=1920, height=1080)
-    
-    # Open browser
-    print("Opening browser...")
-    result = gbox.client.v1.boxes.browser.open(
-        box_id=box.id,
-        show_controls=True
-    )
-    print("✅ Browser opened successfully!")
-    
-    print(f"\n{'='*80}")
-    print("TASK 530: Draft Refund Message")
-    print(f"{'='*80}")
-    print(f"\n📱 Access GBOX at: https://app.gbox.ai")
-    print(f"   Box ID: {box.id}")
-    print(f"\n📋 Steps to complete:")
-    print(f"   1. In the GBOX browser, navigate to: {CONTACT_URL}")
-    print(f"   2. If not logged in, login with:")
-    print(f"      Email: emma.lopez@gmail.com")
-    print(f"      Password: Password.123")
-    print(f"   3. Fill in the contact form:")
-    print(f"      Name: Emma Lopez")
-    print(f"      Email: emma.lopez@gmail.com")
-    print(f"      Message (in 'What's on your mind?' textarea):")
-    print(f"\n{'─'*80}")
-    print(MESSAGE)
-    print(f"{'─'*80}")
-    print(f"\n   4. ⚠️  DO NOT SUBMIT the form!")
-    print(f"\n{'='*80}")
+if open_task_browser(
+    box.id, "TASK 530: Draft Refund Message", STEPS,
+    message=MESSAGE, footer="\n   4. ⚠️  DO NOT SUBMIT the form!", box=box,
+):
     print("\n✅ Browser is ready. Box will remain open.")
     print(f"   Box ID: {box.id}")
-    
-except Exception as e:
-    print(f"\n❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
@@ -15,14 +15,78 @@ For task number mode, it:
 """
 
 import json
-import base64
+import binascii
+import contextlib
+import mmap
 import os
 import re
 import glob
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple
 
+try:
+    # Optional faster JSON parser for large session files
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # Optional SIMD base64 decoder, same errors as binascii
+    from pybase64 import b64decode as b64decode_chunk
+except ImportError:
+    from binascii import a2b_base64 as b64decode_chunk
+
+# Pattern to match log timestamps: 2025-10-26 09:33:12,269
+LOG_TS_RE = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+')
+
+# Creation time is only reported on some platforms (macOS, BSD, Windows)
+HAS_BIRTHTIME = hasattr(os.stat_result, 'st_birthtime')
+
+# Final screenshot names and the per-range temporary names used while scanning
+SCREENSHOT_NAME = "screenshot_%04d.%s"
+TEMP_NAME = ".screenshot_%d_%d.part"
+SCREENSHOT_FILE_RE = re.compile(r'(?:screenshot_\d+\.(?:png|jpg)|\.screenshot_\d+_\d+\.part)\Z')
+
+# Files smaller than this per worker are scanned in a single process
+MIN_RANGE_BYTES = 32 * 1024 * 1024
+
+NEWLINE = ord('\n')
+
+# Base64 characters decoded per write; a multiple of 4 keeps chunks aligned
+B64_CHUNK_CHARS = 4 * 65536
+B64_TAIL_CHARS = frozenset(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/='
+)
+
+
+def write_base64_file(image_data: str, filepath: str) -> int:
+    """
+    Decode base64 data straight into a file, one chunk at a time.
+
+    Truncated payloads are rejected before anything is written, and the
+    partial file is removed if the data turns out to be invalid later on.
+
+    Returns:
+        Number of bytes written
+    """
+    # Screenshot payloads carry no whitespace, so a valid one is a whole
+    # number of 4-character groups ending in padding or an alphabet character
+    if len(image_data) % 4 or image_data[-1] not in B64_TAIL_CHARS:
+        raise binascii.Error(f"Incorrect padding ({len(image_data):,} characters)")
+
+    try:
+        with open(filepath, 'wb') as img_file:
+            for start in range(0, len(image_data), B64_CHUNK_CHARS):
+                chunk = image_data[start:start + B64_CHUNK_CHARS]
+                img_file.write(b64decode_chunk(chunk))
+            return img_file.tell()
+    except Exception:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(filepath)
+        raise
+
 
 def parse_log_timestamps(log_path: str) -> Tuple[datetime, datetime]:
     """
@@ -37,15 +101,16 @@ def parse_log_timestamps(log_path: str) -> Tuple[datetime, datetime]:
     first_ts = None
     last_ts = None
 
-    # Pattern to match log timestamps: 2025-10-26 09:33:12,269
-    ts_pattern = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+')
-
     with open(log_path, 'r', encoding='utf-8') as f:
         for line in f:
-            match = ts_pattern.match(line)
+            match = LOG_TS_RE.match(line)
             if match:
+                # Fixed-width format, so slice the fields instead of strptime
                 ts_str = match.group(1)
-                ts = datetime.strptime(ts_str, '%Y-%m-%d %H:%M:%S')
+                ts = datetime(
+                    int(ts_str[0:4]), int(ts_str[5:7]), int(ts_str[8:10]),
+                    int(ts_str[11:13]), int(ts_str[14:16]), int(ts_str[17:19]),
+                )
 
                 if first_ts is None:
                     first_ts = ts
@@ -79,8 +144,12 @@ def find_jsonl_by_timestamps(
         print(f"⚠️  Warning: Directory not found: {search_path}")
         return None
 
-    # Find all JSONL files
-    jsonl_files = list(search_path.glob("*.jsonl"))
+    # Find all JSONL files; DirEntry caches the stat result it is asked for
+    with os.scandir(search_path) as it:
+        jsonl_files = [
+            entry for entry in it
+            if entry.name.endswith('.jsonl') and entry.is_file()
+        ]
 
     if not jsonl_files:
         print(f"⚠️  Warning: No JSONL files found in {search_path}")
@@ -95,29 +164,42 @@ def find_jsonl_by_timestamps(
     # Allow 5 minute tolerance for timestamp matching
     tolerance_seconds = 300
 
+    # Compare plain epoch seconds; datetimes are only built for matches
+    first_epoch = first_ts.timestamp()
+    last_epoch = last_ts.timestamp()
+
     for jsonl_file in jsonl_files:
         stat = jsonl_file.stat()
-        created = datetime.fromtimestamp(stat.st_birthtime if hasattr(stat, 'st_birthtime') else stat.st_ctime)
-        modified = datetime.fromtimestamp(stat.st_mtime)
 
-        # Calculate how close this file's timestamps are to our target
-        created_diff = abs((created - first_ts).total_seconds())
-        modified_diff = abs((modified - last_ts).total_seconds())
+        # Most sessions were last written at a different time, so rule
+        # them out on mtime before looking at the creation time
+        modified_diff = abs(stat.st_mtime - last_epoch)
+        if modified_diff > tolerance_seconds:
+            continue
+
+        created_epoch = stat.st_birthtime if HAS_BIRTHTIME else stat.st_ctime
+        created_diff = abs(created_epoch - first_epoch)
 
         total_diff = created_diff + modified_diff
 
         # Check if within tolerance
-        if created_diff <= tolerance_seconds and modified_diff <= tolerance_seconds:
+        if created_diff <= tolerance_seconds:
             if total_diff < best_score:
                 best_score = total_diff
-                best_match = jsonl_file
+                best_match = jsonl_file.path
+                created = datetime.fromtimestamp(created_epoch)
+                modified = datetime.fromtimestamp(stat.st_mtime)
                 print(f"   ✓ Match found: {jsonl_file.name}")
                 print(f"     Created: {created}, Modified: {modified}")
                 print(f"     Score: {total_diff:.1f}s difference")
 
+                # Within a second on both ends is as good as a match gets
+                if total_diff < 1.0:
+                    break
+
     if best_match:
         print(f"✅ Best match: {best_match}")
-        return str(best_match)
+        return best_match
     else:
         print(f"❌ No JSONL file found matching timestamps")
         return None
@@ -134,15 +216,17 @@ def find_log_file_for_task(task_num: int, log_dir: str = "log_files") -> Optiona
     Returns:
         Path to log file, or None if not found
     """
-    log_path = Path(log_dir)
-
-    if not log_path.exists():
+    if not os.path.isdir(log_dir):
         print(f"❌ Error: Log directory not found: {log_dir}")
         return None
 
     # Pattern: task_174_20251026_093312.log
-    pattern = f"task_{task_num}_*.log"
-    matches = list(log_path.glob(pattern))
+    prefix = f"task_{task_num}_"
+    with os.scandir(log_dir) as it:
+        matches = [
+            (entry.stat().st_mtime, entry.path) for entry in it
+            if entry.name.startswith(prefix) and entry.name.endswith('.log')
+        ]
 
     if not matches:
         print(f"❌ Error: No log file found for task {task_num} in {log_dir}/")
@@ -150,12 +234,122 @@ def find_log_file_for_task(task_num: int, log_dir: str = "log_files") -> Optiona
 
     if len(matches) > 1:
         # Sort by modification time, take the most recent
-        matches.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        matches.sort(reverse=True)
         print(f"⚠️  Found {len(matches)} log files, using most recent")
 
-    log_file = matches[0]
+    log_file = matches[0][1]
     print(f"📋 Found log file: {log_file}")
-    return str(log_file)
+    return log_file
+
+
+def scan_range(jsonl_path: str, start: int, end: int, output_dir: str, range_id: int) -> Tuple[int, list]:
+    """
+    Extract screenshots from the lines that start within [start, end) of a JSONL file.
+
+    Images are written under temporary names; extract_screenshots assigns
+    the final, globally numbered names once all ranges are done.
+
+    Returns:
+        (number of lines scanned, events in file order), where an event is
+        ('image', temp_path or None, ext, size or error) or
+        ('skip' / 'error', local line number, message)
+    """
+    events = []
+    line_num = 0
+    image_num = 0
+
+    if start >= end:
+        return line_num, events
+
+    # Lines are located and prefiltered in the mapped file, so only
+    # screenshot lines (MBs each) are copied out; both parsers take bytes
+    with open(jsonl_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        mm_end = len(mm)
+        pos = start
+        if start and mm[start - 1] != NEWLINE:
+            # A line belongs to the range holding its first byte
+            pos = mm.find(b'\n', start) + 1 or mm_end
+
+        while pos < end and pos < mm_end:
+            eol = mm.find(b'\n', pos)
+            if eol < 0:
+                eol = mm_end
+            line_start, pos = pos, eol + 1
+            line_num += 1
+
+            # A screenshot record always serializes an "image" content item
+            # inside a tool_result, so skip everything else unparsed
+            if (mm.find(b'"image"', line_start, eol) < 0
+                    or mm.find(b'tool_result', line_start, eol) < 0):
+                continue
+            line = mm[line_start:eol]
+
+            try:
+                # Parse JSON line
+                data = json_loads(line)
+
+                # Look for tool results with images; records of any other
+                # shape fail one of the lookups and are skipped
+                try:
+                    message = data['message']
+                    if data['type'] != 'user' or message['role'] != 'user':
+                        continue
+                    content = message['content']
+                except (KeyError, TypeError):
+                    continue
+
+                # Content can be a list of tool results
+                if not isinstance(content, list):
+                    continue
+
+                for item in content:
+                    try:
+                        if item['type'] != 'tool_result':
+                            continue
+                        # Check tool result content for images
+                        tool_content = item['content']
+                    except (KeyError, TypeError):
+                        continue
+                    if not isinstance(tool_content, list):
+                        continue
+
+                    for tool_item in tool_content:
+                        try:
+                            if tool_item['type'] != 'image':
+                                continue
+                            # Extract base64 image data
+                            source = tool_item.get('source', {})
+                            image_data = source.get('data', '')
+                            media_type = source.get('media_type', 'image/png')
+                        except (KeyError, TypeError, AttributeError):
+                            continue
+
+                        if not image_data:
+                            continue
+                        image_num += 1
+
+                        # Determine file extension
+                        ext = 'png'
+                        if 'jpeg' in media_type or 'jpg' in media_type:
+                            ext = 'jpg'
+
+                        # Save image
+                        filepath = os.path.join(output_dir, TEMP_NAME % (range_id, image_num))
+
+                        try:
+                            # Decode and save
+                            size = write_base64_file(image_data, filepath)
+                            events.append(('image', filepath, ext, size))
+                        except Exception as e:
+                            events.append(('image', None, ext, e))
+
+            except json.JSONDecodeError as e:
+                events.append(('skip', line_num, f"Invalid JSON - {e}"))
+            except Exception as e:
+                events.append(('error', line_num, str(e)))
+
+    return line_num, events
 
 
 def extract_screenshots(jsonl_path: str, output_dir: str = "trace") -> int:
@@ -175,72 +369,51 @@ def extract_screenshots(jsonl_path: str, output_dir: str = "trace") -> int:
     # Clear existing screenshots if directory exists
     if output_path.exists():
         print(f"🗑️  Clearing existing screenshots in {output_dir}/")
-        for file in output_path.glob("screenshot_*.png"):
-            file.unlink()
-        for file in output_path.glob("screenshot_*.jpg"):
-            file.unlink()
+        with os.scandir(output_path) as it:
+            for entry in it:
+                if SCREENSHOT_FILE_RE.match(entry.name):
+                    os.unlink(entry.path)
     else:
         output_path.mkdir(exist_ok=True)
 
-    screenshot_count = 0
-
     print(f"📖 Reading {jsonl_path}...")
     print(f"💾 Saving screenshots to {output_dir}/")
 
-    with open(jsonl_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            try:
-                # Parse JSON line
-                data = json.loads(line.strip())
-
-                # Look for tool results with images
-                if data.get('type') == 'user' and 'message' in data:
-                    message = data['message']
-
-                    # Check if this is a tool result
-                    if message.get('role') == 'user' and 'content' in message:
-                        content = message['content']
-
-                        # Content can be a list of tool results
-                        if isinstance(content, list):
-                            for item in content:
-                                if isinstance(item, dict) and item.get('type') == 'tool_result':
-                                    # Check tool result content for images
-                                    tool_content = item.get('content', [])
-                                    if isinstance(tool_content, list):
-                                        for tool_item in tool_content:
-                                            if isinstance(tool_item, dict) and tool_item.get('type') == 'image':
-                                                # Extract base64 image data
-                                                source = tool_item.get('source', {})
-                                                image_data = source.get('data', '')
-                                                media_type = source.get('media_type', 'image/png')
-
-                                                if image_data:
-                                                    screenshot_count += 1
-
-                                                    # Determine file extension
-                                                    ext = 'png'
-                                                    if 'jpeg' in media_type or 'jpg' in media_type:
-                                                        ext = 'jpg'
-
-                                                    # Save image
-                                                    filename = f"screenshot_{screenshot_count:04d}.{ext}"
-                                                    filepath = output_path / filename
-
-                                                    try:
-                                                        # Decode and save
-                                                        image_bytes = base64.b64decode(image_data)
-                                                        with open(filepath, 'wb') as img_file:
-                                                            img_file.write(image_bytes)
-
-                                                        print(f"✅ Extracted: {filename} ({len(image_bytes):,} bytes)")
-                                                    except Exception as e:
-                                                        print(f"⚠️  Failed to decode image {screenshot_count}: {e}")
+    # Lines are independent, so large files are split into byte ranges that
+    # are scanned in parallel; small files are not worth the process startup
+    file_size = os.path.getsize(jsonl_path)
+    workers = max(1, min(os.cpu_count() or 1, file_size // MIN_RANGE_BYTES))
+    bounds = [file_size * i // workers for i in range(workers + 1)]
+    ranges = [
+        (jsonl_path, bounds[i], bounds[i + 1], output_dir, i)
+        for i in range(workers)
+    ]
+    if workers == 1:
+        results = [scan_range(*ranges[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(scan_range, *zip(*ranges)))
 
-            except json.JSONDecodeError as e:
-                print(f"⚠️  Skipping line {line_num}: Invalid JSON - {e}")
-            except Exception as e:
-                print(f"⚠️  Error processing line {line_num}: {e}")
+    screenshot_count = 0
+    line_offset = 0
+    for line_count, events in results:
+        for kind, *event in events:
+            if kind == 'image':
+                temp_path, ext, result = event
+                screenshot_count += 1
+                if temp_path is None:
+                    print(f"⚠️  Failed to decode image {screenshot_count}: {result}")
+                    continue
+                filename = SCREENSHOT_NAME % (screenshot_count, ext)
+                os.replace(temp_path, os.path.join(output_dir, filename))
+                print(f"✅ Extracted: {filename} ({result:,} bytes)")
+            elif kind == 'skip':
+                line_num, message = event
+                print(f"⚠️  Skipping line {line_offset + line_num}: {message}")
+            else:
+                line_num, message = event
+                print(f"⚠️  Error processing line {line_offset + line_num}: {message}")
+        line_offset += line_count
 
     print(f"\n🎉 Done! Extracted {screenshot_count} screenshots to {output_dir}/")
     return screenshot_count
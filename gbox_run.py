@@ -1,17 +1,32 @@
 """Run WebArena evaluation using Claude via gbox-mcp"""
 import argparse
-import glob
+import atexit
+import functools
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
+import queue
 import random
-import subprocess
+import re
+import shutil
 import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from gbox_sdk import GboxSDK
 
+try:
+    # Optional faster JSON parser for task configs
+    import orjson
+except ImportError:
+    orjson = None
+
 from agent.gbox_claude_agent import GboxClaudeAgent
 from browser_env import (
     ActionTypes,
@@ -21,7 +36,15 @@ from browser_env import (
     create_stop_action,
 )
 from browser_env.actions import is_equivalent
-from browser_env.auto_login import get_site_comb_from_filepath
+from browser_env.auto_login import (
+    EXACT_MATCH,
+    KEYWORDS,
+    SITES,
+    URLS,
+    get_site_comb_from_filepath,
+    is_expired,
+    renew_comb,
+)
 from browser_env.helper_functions import RenderHelper
 from evaluation_harness import evaluator_router
 
@@ -48,15 +71,62 @@ VIEWPORT_HEIGHT = 980
 BOX_RESOLUTION_WIDTH = 1920
 BOX_RESOLUTION_HEIGHT = 1080
 MAX_STEPS = 30
+# Evaluators that only look at the trajectory and the page url
+URL_STRING_EVAL_TYPES = {"url_match", "string_match"}
 HEADLESS = False
 SAVE_TRACE = True
+# Evaluation never reads traces and the visual agent works from screenshots,
+# so leave the DOM snapshots out to keep trace capture and saving cheap
+TRACE_SNAPSHOTS = False
 RENDER_SCREENSHOT = True
 PARSING_FAILURE_TH = 3
 REPEATING_ACTION_TH = 3
 
+# Logins are reused across tasks for the same site combination. A cached login
+# is checked against every site before each reuse (a task may log out or the
+# sites may be reset) and is renewed regardless once it is LOGIN_CACHE_TTL
+# seconds (6 h) old.
+LOGIN_CACHE_DIR = Path("cache/auto_login")
+LOGIN_CACHE_TTL = 6 * 60 * 60
+# Task configs rewritten to point at the cached logins
+LOGIN_CONFIG_DIR = LOGIN_CACHE_DIR / "configs"
+
+# Rendered tasks are saved as render_<task_id>.html
+RENDER_TASK_RE = re.compile(r"_(\d+)\.html\Z")
+
 LOG_FOLDER = "log_files"
+LOG_BUFFER_BYTES = 1 << 16
+# monitor_logs and analyze_logs read the task logs while they are written, so
+# a buffered tail is never held for long, and task-end records go out at once
+LOG_FLUSH_INTERVAL = 2.0
+LOG_FLUSH_MARKERS = ("[Result]", "[Unhandled Error]")
 Path(LOG_FOLDER).mkdir(parents=True, exist_ok=True)
 
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a large buffer and only flushes on
+    errors and task-end records.
+
+    The periodic flush thread and close() push out everything else.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_BYTES,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR or (
+                isinstance(record.msg, str) and record.msg.startswith(LOG_FLUSH_MARKERS)
+            ):
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 logger = logging.getLogger("logger")
 logger.setLevel(logging.DEBUG)
 
@@ -70,226 +140,474 @@ console_handler.setLevel(logging.DEBUG)
 formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 console_handler.setFormatter(formatter)
 
-logger.addHandler(console_handler)
-agent_logger.addHandler(console_handler)
+# Loggers only enqueue records; a listener thread formats and writes them to
+# the console and to the current task's log file
+log_queue = queue.Queue(-1)
+queue_handler = QueueHandler(log_queue)
+logger.addHandler(queue_handler)
+agent_logger.addHandler(queue_handler)
+
+log_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 
-def early_stop(trajectory, max_steps, thresholds):
+def _flush_logs_periodically():
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        for handler in log_listener.handlers:
+            handler.flush()
+
+
+threading.Thread(target=_flush_logs_periodically, name="log-flush", daemon=True).start()
+
+
+class ActionSlots:
+    """Incremental copy of the trajectory entries early_stop inspects.
+
+    The stop rules look at trajectory[1::2], the odd-indexed entries (with
+    NONE actions, which add no state, these are every other action).
+    update() mirrors each new odd-indexed entry as the trajectory grows, so
+    those rules never re-slice the trajectory.
+    """
+
+    def __init__(self, max_k):
+        self.synced = 0
+        self.count = 0
+        # the latest max_k entries of trajectory[1::2]
+        self.recent = deque(maxlen=max_k)
+        # the entries of trajectory[1::2] is_equivalent can match against a
+        # TYPE action: TYPE actions and any state that landed on an odd index
+        self.type_actions = []
+
+    def update(self, trajectory):
+        for index in range(self.synced, len(trajectory)):
+            if index % 2:
+                entry = trajectory[index]
+                self.count += 1
+                self.recent.append(entry)
+                if "action_type" not in entry or entry["action_type"] == ActionTypes.TYPE:
+                    self.type_actions.append(entry)
+        self.synced = len(trajectory)
+
+
+def early_stop(trajectory, max_steps, thresholds, slots):
+    """Check the stop rules; slots is the ActionSlots kept for trajectory."""
     num_steps = (len(trajectory) - 1) / 2
     if num_steps >= max_steps:
         return True, f"Reach max steps {max_steps}"
 
+    slots.update(trajectory)
+
     k = thresholds["parsing_failure"]
-    last_k_actions = trajectory[1::2][-k:]
+    last_k_actions = list(slots.recent)[-k:]
     if len(last_k_actions) >= k:
         if all([action["action_type"] == ActionTypes.NONE for action in last_k_actions]):
             return True, f"Failed to parse actions for {k} times"
 
     k = thresholds["repeating_action"]
-    last_k_actions = trajectory[1::2][-k:]
-    action_seq = trajectory[1::2]
+    last_k_actions = list(slots.recent)[-k:]
 
-    if len(action_seq) == 0:
+    if slots.count == 0:
         return False, ""
 
-    last_action = action_seq[-1]
+    last_action = slots.recent[-1]
 
     if last_action["action_type"] != ActionTypes.TYPE:
         if len(last_k_actions) >= k:
             if all([is_equivalent(action, last_action) for action in last_k_actions]):
                 return True, f"Same action for {k} times"
     else:
-        if sum([is_equivalent(action, last_action) for action in action_seq]) >= k:
+        # Other actions never match a TYPE action, so only these need comparing
+        if sum([is_equivalent(action, last_action) for action in slots.type_actions]) >= k:
             return True, f"Same typing action for {k} times"
 
     return False, ""
 
 
+@functools.lru_cache(maxsize=4096)
+def _read_config(path, mtime_ns, size):
+    """Parse a task config; mtime_ns and size are only part of the cache key."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def load_config(path):
+    """Return a task config, parsing the file again only once it changes.
+
+    The result is a shallow copy, so callers may replace top-level keys.
+    """
+    st = os.stat(path)
+    return dict(_read_config(path, st.st_mtime_ns, st.st_size))
+
+
+def run_playwright_call(func, *args, **kwargs):
+    """Run a sync Playwright helper from auto_login and return its result.
+
+    It needs its own thread since the env keeps a sync Playwright instance
+    in this one.
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="auto-login") as executor:
+        return executor.submit(func, *args, **kwargs).result()
+
+
+def login_is_valid(storage_state, comb):
+    """Whether storage_state is still logged in to every site of comb."""
+    for site in comb:
+        if site not in SITES:
+            continue
+        index = SITES.index(site)
+        if is_expired(storage_state, URLS[index], KEYWORDS[index], EXACT_MATCH[index]):
+            return False
+    return True
+
+
+def ensure_login(comb, cookie_file_name):
+    """Return a storage state file for the site combination, logging in only if the cached one is missing, stale or logged out."""
+    cache_dir = LOGIN_CACHE_DIR / hashlib.sha1(".".join(comb).encode()).hexdigest()
+    cached = cache_dir / cookie_file_name
+    try:
+        fresh = time.time() - cached.stat().st_mtime < LOGIN_CACHE_TTL
+    except FileNotFoundError:
+        fresh = False
+    if fresh and run_playwright_call(login_is_valid, cached, comb):
+        logger.info("Reusing cached login for %s", ", ".join(comb))
+        return str(cached)
+
+    # Log in to a scratch dir and move the result into place, so parallel
+    # workers never pick up a partially written file
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    temp_dir = tempfile.mkdtemp(dir=cache_dir)
+    try:
+        # Log in in-process rather than in a new interpreter
+        run_playwright_call(renew_comb, comb, auth_folder=temp_dir)
+        os.replace(f"{temp_dir}/{cookie_file_name}", cached)
+    finally:
+        # Also removes what a failed login left behind
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return str(cached)
+
+
+def write_login_config(config_file, config):
+    """Save config (with its storage_state pointing at the cached login) and return the new path.
+
+    The cached login paths are stable, so the copy is only rewritten once the
+    source config changes. Copies are kept per source path (same-named configs
+    in different directories get their own), under the source's file name.
+    """
+    source_key = hashlib.sha1(os.path.abspath(config_file).encode()).hexdigest()[:16]
+    target = LOGIN_CONFIG_DIR / source_key / os.path.basename(config_file)
+    try:
+        if target.stat().st_mtime_ns >= os.stat(config_file).st_mtime_ns:
+            return str(target)
+    except FileNotFoundError:
+        pass
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = target.with_name(f".{target.name}.{os.getpid()}")
+    temp_file.write_bytes(orjson.dumps(config) if orjson else json.dumps(config).encode())
+    os.replace(temp_file, target)
+    return str(target)
+
+
+def ensure_active_page(env, eval_types):
+    """Point env.page at the active tab and give it the CDP client the evaluators need.
+
+    Switching tabs and opening a CDP session are skipped when they would be a no-op.
+    """
+    if not (getattr(env, "context", None) and env.context.pages):
+        return
+    active = env.context.pages[-1]
+    if active is not env.page:
+        env.page = active
+        env.page.bring_to_front()
+
+    if set(eval_types) <= URL_STRING_EVAL_TYPES:
+        # No accessibility data is read, skip the CDP round-trips
+        logger.debug("Skipping CDP session for eval types %s", eval_types)
+        if not hasattr(env.page, "client"):
+            env.page.client = None  # type: ignore[attr-defined]
+    elif getattr(env.page, "client", None) is None:
+        logger.debug("Opening CDP session for eval types %s", eval_types)
+        env.page.client = env.page.context.new_cdp_session(env.page)  # type: ignore[attr-defined]
+        env.page.client.send("Accessibility.enable")  # type: ignore[attr-defined]
+
+
+def open_box_browser(gbox_client, box_id):
+    """Open the browser in the box and return its CDP url."""
+    logger.info("Opening browser in box %s", box_id)
+    open_result = gbox_client.v1.boxes.browser.open(
+        box_id=box_id,
+        show_controls=False  # Hide browser UI - visual agent doesn't need address bar
+    )
+    logger.info("Browser opened with fresh CDP URL")
+    return open_result.cdp_url
+
+
+def reset_env(env, config_file, gbox_client, box_id):
+    """Reset env for the task, reopening the box browser once if the connection to it was lost."""
+    try:
+        return env.reset(options={"config_file": config_file})
+    except Exception:
+        if env.browser is not None and env.browser.is_connected():
+            raise
+    logger.warning("Lost connection to the box browser, reopening it")
+    env.cdp_url = open_box_browser(gbox_client, box_id)
+    return env.reset(options={"config_file": config_file})
+
+
+def run_agent_loop(agent, env, intent, trajectory, thresholds, render_helper, io_pool):
+    """Let the agent act until it stops, extending trajectory in place.
+
+    Renders are submitted to io_pool; returns their futures.
+    """
+    # Bound once, these are looked up on every step
+    STOP, NONE = ActionTypes.STOP, ActionTypes.NONE
+    next_action = agent.next_action
+    step = env.step
+    submit = io_pool.submit
+    render = render_helper.render
+
+    slots = ActionSlots(max(thresholds.values()))
+    pending = []
+    state_info = trajectory[-1]
+    meta_data = {"action_history": ["None"]}
+    while True:
+        early_stop_flag, stop_info = early_stop(trajectory, MAX_STEPS, thresholds, slots)
+
+        if early_stop_flag:
+            action = create_stop_action(f"Early stop: {stop_info}")
+        else:
+            try:
+                action = next_action(trajectory, intent, meta_data=meta_data)
+            except ValueError as e:
+                action = create_stop_action(f"ERROR: {str(e)}")
+
+        trajectory.append(action)
+        action_type = action["action_type"]
+
+        action_str = f"{action_type}: {action.get('answer', '')}"
+        # The loop keeps appending to action_history, so hand over a snapshot
+        pending.append(submit(
+            render,
+            action,
+            state_info,
+            {**meta_data, "action_history": list(meta_data["action_history"])},
+            RENDER_SCREENSHOT,
+        ))
+        meta_data["action_history"].append(action_str)
+
+        if action_type == STOP:
+            break
+
+        if action_type == NONE:
+            continue
+
+        obs, _, terminated, _, info = step(action)
+        state_info = {"observation": obs, "info": info}
+        trajectory.append(state_info)
+
+        if terminated:
+            trajectory.append(create_stop_action(""))
+            break
+
+    return pending
+
+
 def test(agent, config_file_list, box_id, gbox_client, result_dir):
-    """Run tasks with fresh browser session per task."""
+    """Run tasks in one box browser, with a fresh browser context per task, and return their scores."""
     scores = []
     early_stop_thresholds = {
         "parsing_failure": PARSING_FAILURE_TH,
         "repeating_action": REPEATING_ACTION_TH,
     }
+    # error.txt is opened on the first failure and kept open for the rest of the run
+    error_file = None
+
+    # The box browser and the env's connection to it last for the whole run;
+    # env.reset only swaps in a new browser context per task
+    env = None
+
+    try:
+        for config_file in config_file_list:
+            task_file_handler = None
+            # Renders only write the result html, so they run behind the agent loop
+            io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+            try:
+                # 0. SETUP PER-TASK LOG FILE
+                # Extract task_id from config file path (e.g., "config_files/9.json" -> "9")
+                task_id = os.path.basename(config_file).replace('.json', '')
+                task_log_file = f"{LOG_FOLDER}/task_{task_id}_{time.strftime('%Y%m%d_%H%M%S')}.log"
+
+                # Create file handler for this task
+                task_file_handler = BufferedFileHandler(task_log_file)
+                task_file_handler.setLevel(logging.DEBUG)
+                task_file_handler.setFormatter(formatter)
+
+                # Records from both loggers reach it through the listener
+                log_listener.handlers = (console_handler, task_file_handler)
+
+                logger.info("📝 Logging to: %s", task_log_file)
+
+                # 1. OPEN BROWSER AND CREATE ENV ON FIRST USE (reused by later tasks)
+                if env is None:
+                    env = ScriptBrowserEnv(
+                        headless=HEADLESS,
+                        slow_mo=0,
+                        observation_type=OBSERVATION_TYPE,
+                        current_viewport_only=True,
+                        viewport_size={"width": VIEWPORT_WIDTH, "height": VIEWPORT_HEIGHT},
+                        save_trace_enabled=SAVE_TRACE,
+                        trace_snapshots=TRACE_SNAPSHOTS,
+                        sleep_after_execution=0.0,
+                        cdp_url=open_box_browser(gbox_client, box_id),
+                        skip_observation_extraction=True,  # Visual GBOX agent doesn't need DOM extraction
+                    )
 
-    for config_file in config_file_list:
-        env = None
-        cdp_url = None
-        task_file_handler = None
-        try:
-            # 0. SETUP PER-TASK LOG FILE
-            # Extract task_id from config file path (e.g., "config_files/9.json" -> "9")
-            task_id = os.path.basename(config_file).replace('.json', '')
-            task_log_file = f"{LOG_FOLDER}/task_{task_id}_{time.strftime('%Y%m%d_%H%M%S')}.log"
-
-            # Create file handler for this task
-            task_file_handler = logging.FileHandler(task_log_file)
-            task_file_handler.setLevel(logging.DEBUG)
-            task_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-
-            # Add handler to both loggers
-            logger.addHandler(task_file_handler)
-            agent_logger.addHandler(task_file_handler)
-
-            logger.info(f"📝 Logging to: {task_log_file}")
-
-            # 1. OPEN BROWSER FOR THIS TASK
-            logger.info(f"Opening browser for task {config_file}")
-            open_result = gbox_client.v1.boxes.browser.open(
-                box_id=box_id,
-                show_controls=False  # Hide browser UI - visual agent doesn't need address bar
-            )
-            cdp_url = open_result.cdp_url
-            logger.info(f"Browser opened with fresh CDP URL")
-
-            # 2. CREATE FRESH ENV FOR THIS TASK
-            env = ScriptBrowserEnv(
-                headless=HEADLESS,
-                slow_mo=0,
-                observation_type=OBSERVATION_TYPE,
-                current_viewport_only=True,
-                viewport_size={"width": VIEWPORT_WIDTH, "height": VIEWPORT_HEIGHT},
-                save_trace_enabled=SAVE_TRACE,
-                sleep_after_execution=0.0,
-                cdp_url=cdp_url,
-                skip_observation_extraction=True,  # Visual GBOX agent doesn't need DOM extraction
-            )
-
-            render_helper = RenderHelper(config_file, result_dir, ACTION_SET_TAG)
-
-            with open(config_file) as f:
-                _c = json.load(f)
+                render_helper = RenderHelper(config_file, result_dir, ACTION_SET_TAG)
+
+                _c = load_config(config_file)
                 intent = _c["intent"]
                 task_id = _c["task_id"]
+                eval_types = _c["eval"]["eval_types"]
 
                 if _c["storage_state"]:
                     cookie_file_name = os.path.basename(_c["storage_state"])
                     comb = get_site_comb_from_filepath(cookie_file_name)
-                    temp_dir = tempfile.mkdtemp()
-                    subprocess.run(
-                        ["python", "browser_env/auto_login.py", "--auth_folder", temp_dir, "--site_list", *comb]
-                    )
-                    _c["storage_state"] = f"{temp_dir}/{cookie_file_name}"
-                    assert os.path.exists(_c["storage_state"])
-                    config_file = f"{temp_dir}/{os.path.basename(config_file)}"
-                    with open(config_file, "w") as f:
-                        json.dump(_c, f)
-
-            logger.info(f"[Config file]: {config_file}")
-            logger.info(f"[Intent]: {intent}")
-
-            agent.reset(config_file)
-            trajectory: Trajectory = []
-            obs, info = env.reset(options={"config_file": config_file})
-            state_info: StateInfo = {"observation": obs, "info": info}
-            trajectory.append(state_info)
-
-            meta_data = {"action_history": ["None"]}
-            while True:
-                early_stop_flag, stop_info = early_stop(trajectory, MAX_STEPS, early_stop_thresholds)
-
-                if early_stop_flag:
-                    action = create_stop_action(f"Early stop: {stop_info}")
-                else:
-                    try:
-                        action = agent.next_action(trajectory, intent, meta_data=meta_data)
-                    except ValueError as e:
-                        action = create_stop_action(f"ERROR: {str(e)}")
+                    _c["storage_state"] = ensure_login(comb, cookie_file_name)
+                    config_file = write_login_config(config_file, _c)
 
-                trajectory.append(action)
+                logger.info("[Config file]: %s", config_file)
+                logger.info("[Intent]: %s", intent)
 
-                action_str = f"{action['action_type']}: {action.get('answer', '')}"
-                render_helper.render(action, state_info, meta_data, RENDER_SCREENSHOT)
-                meta_data["action_history"].append(action_str)
+                agent.reset(config_file)
+                trajectory: Trajectory = []
+                # 2. FRESH BROWSER CONTEXT FOR THIS TASK
+                obs, info = reset_env(env, config_file, gbox_client, box_id)
+                state_info: StateInfo = {"observation": obs, "info": info}
+                trajectory.append(state_info)
 
-                if action["action_type"] == ActionTypes.STOP:
-                    break
+                pending = run_agent_loop(
+                    agent, env, intent, trajectory, early_stop_thresholds, render_helper, io_pool
+                )
 
-                if action["action_type"] == ActionTypes.NONE:
-                    continue
+                # Ensure env.page references the active tab (handles new-tab navigation)
+                try:
+                    ensure_active_page(env, eval_types)
+                except Exception as e:
+                    logger.debug("Unable to refresh active page reference: %s", e)
 
-                obs, _, terminated, _, info = env.step(action)
-                state_info = {"observation": obs, "info": info}
-                trajectory.append(state_info)
+                evaluator = evaluator_router(config_file)
+                score = evaluator(
+                    trajectory=trajectory,
+                    config_file=config_file,
+                    page=env.page,
+                    client=env.get_page_client(env.page),
+                )
 
-                if terminated:
-                    trajectory.append(create_stop_action(""))
-                    break
+                scores.append(score)
+
+                if score == 1:
+                    logger.info("[Result] (PASS) %s", config_file)
+                else:
+                    logger.info("[Result] (FAIL) %s", config_file)
 
-            # Ensure env.page references the active tab (handles new-tab navigation)
+                if SAVE_TRACE:
+                    env.save_trace(Path(result_dir) / "traces" / f"{task_id}.zip")
+
+                # Surface render errors like any other task error
+                for future in pending:
+                    future.result()
+
+            except Exception as e:
+                logger.info("[Unhandled Error] %r", e)
+                import traceback
+                if error_file is None:
+                    error_file = open(Path(result_dir) / "error.txt", "ab", buffering=1 << 16)
+                # The whole report goes out in one append, so reports from
+                # parallel workers don't interleave
+                error_file.write(
+                    f"[Config file]: {config_file}\n"
+                    f"[Unhandled Error] {repr(e)}\n"
+                    f"{traceback.format_exc()}".encode()
+                )
+                error_file.flush()
+
+            finally:
+                io_pool.shutdown(wait=True)
+
+                # 3. REMOVE TASK-SPECIFIC LOG HANDLER
+                if task_file_handler:
+                    # Let the listener write out this task's queued records first
+                    log_queue.join()
+                    log_listener.handlers = (console_handler,)
+                    task_file_handler.close()
+
+            render_helper.close()
+
+    finally:
+        # 4. ALWAYS CLOSE ENV AND BROWSER (box stays alive)
+        if env is not None:
             try:
-                if getattr(env, "context", None) and env.context.pages:
-                    env.page = env.context.pages[-1]
-                    env.page.bring_to_front()
-                    env.page.client = env.page.context.new_cdp_session(env.page)  # type: ignore[attr-defined]
-                    env.page.client.send("Accessibility.enable")  # type: ignore[attr-defined]
+                env.close()
+                logger.info("Closed environment")
             except Exception as e:
-                logger.debug(f"Unable to refresh active page reference: {e}")
-
-            evaluator = evaluator_router(config_file)
-            score = evaluator(
-                trajectory=trajectory,
-                config_file=config_file,
-                page=env.page,
-                client=env.get_page_client(env.page),
-            )
-
-            scores.append(score)
-
-            if score == 1:
-                logger.info(f"[Result] (PASS) {config_file}")
-            else:
-                logger.info(f"[Result] (FAIL) {config_file}")
-
-            if SAVE_TRACE:
-                env.save_trace(Path(result_dir) / "traces" / f"{task_id}.zip")
-
-        except Exception as e:
-            logger.info(f"[Unhandled Error] {repr(e)}")
-            import traceback
-            with open(Path(result_dir) / "error.txt", "a") as f:
-                f.write(f"[Config file]: {config_file}\n")
-                f.write(f"[Unhandled Error] {repr(e)}\n")
-                f.write(traceback.format_exc())
-
-        finally:
-            # 3. ALWAYS CLOSE BROWSER AND ENV (box stays alive)
-            if env:
-                try:
-                    env.close()
-                    logger.info(f"Closed environment for task")
-                except Exception as e:
-                    logger.warning(f"Failed to close environment: {e}")
+                logger.warning("Failed to close environment: %s", e)
 
             try:
                 gbox_client.v1.boxes.browser.close(box_id=box_id)
-                logger.info(f"Closed browser for task")
+                logger.info("Closed browser")
             except Exception as e:
-                logger.warning(f"Failed to close browser: {e}")
+                logger.warning("Failed to close browser: %s", e)
 
-            # 4. REMOVE TASK-SPECIFIC LOG HANDLER
-            if task_file_handler:
-                logger.removeHandler(task_file_handler)
-                agent_logger.removeHandler(task_file_handler)
-                task_file_handler.close()
+        if error_file is not None:
+            error_file.close()
 
-        render_helper.close()
+    return scores
 
-    # All tasks complete
-    if scores:
-        logger.info(f"Average score: {sum(scores) / len(scores)}")
+
+def run_on_box(box_id, config_file_list, provider, result_dir):
+    """Set up one box and its agent, run the given tasks on it and return their scores."""
+    gbox = GboxSDK()
+    box = gbox.get(box_id)
+
+    logger.info("Setting box %s resolution to %dx%d", box_id, BOX_RESOLUTION_WIDTH, BOX_RESOLUTION_HEIGHT)
+    box.resolution.set(width=BOX_RESOLUTION_WIDTH, height=BOX_RESOLUTION_HEIGHT)
+
+    logger.info("Box %s ready - browser is reused, fresh context per task", box_id)
+
+    agent = GboxClaudeAgent(
+        box_id=box_id,
+        action_set_tag=ACTION_SET_TAG,
+        server_name=SERVER_NAME,
+        model=PROVIDER_MODELS[provider]["primary"],
+        gbox_client=gbox.client,
+        use_bedrock=(provider == "bedrock"),
+        fallback_model=PROVIDER_MODELS[provider]["fallback"],
+    )
+
+    try:
+        logger.info("Running %d tasks on box %s (fresh context per task)", len(config_file_list), box_id)
+        return test(agent, config_file_list, box_id, gbox.client, result_dir)
+    finally:
+        agent.close()
 
 
 def get_unfinished(config_files, result_dir):
-    result_files = glob.glob(f"{result_dir}/*.html")
-    task_ids = [os.path.basename(f).split(".")[0].split("_")[1] for f in result_files]
-    unfinished_configs = []
-    for config_file in config_files:
-        task_id = os.path.basename(config_file).split(".")[0]
-        if task_id not in task_ids:
-            unfinished_configs.append(config_file)
-    return unfinished_configs
+    try:
+        with os.scandir(result_dir) as it:
+            task_ids = {
+                match.group(1)
+                for entry in it
+                if (match := RENDER_TASK_RE.search(entry.name))
+            }
+    except FileNotFoundError:
+        task_ids = set()
+    return [
+        config_file for config_file in config_files
+        if os.path.splitext(os.path.basename(config_file))[0] not in task_ids
+    ]
 
 
 def prepare(args: argparse.Namespace) -> None:
@@ -321,7 +639,10 @@ Examples:
   # Run tasks 0-10 on default box
   python gbox_run.py --start 0 --end 10
 
-  # Run tasks in parallel on multiple boxes (same result dir)
+  # Run tasks in parallel on multiple boxes from one process
+  python gbox_run.py --start 0 --end 15 --box_ids <box1>,<box2>,<box3>
+
+  # Or split the range by hand (same result dir)
   Terminal 1: python gbox_run.py --start 0 --end 5 --box_id <box1> --result_dir results_run1
   Terminal 2: python gbox_run.py --start 5 --end 10 --box_id <box2> --result_dir results_run1
   Terminal 3: python gbox_run.py --start 10 --end 15 --box_id <box3> --result_dir results_run1
@@ -346,6 +667,12 @@ Examples:
         default=DEFAULT_BOX_ID,
         help=f"GBOX box ID to use (default: {DEFAULT_BOX_ID})"
     )
+    parser.add_argument(
+        "--box_ids",
+        type=str,
+        default="",
+        help="Comma-separated GBOX box IDs; tasks are split across them and run in parallel (overrides --box_id)"
+    )
     parser.add_argument(
         "--result_dir",
         type=str,
@@ -366,19 +693,18 @@ Examples:
 
     TEST_START_IDX = args.start
     TEST_END_IDX = args.end
-    BOX_ID = args.box_id
+    BOX_IDS = [b.strip() for b in args.box_ids.split(",") if b.strip()] or [args.box_id]
     RESULT_DIR = args.result_dir
     PROVIDER = args.provider
 
     # Get models for selected provider
     MODEL = PROVIDER_MODELS[PROVIDER]["primary"]
-    FALLBACK_MODEL = PROVIDER_MODELS[PROVIDER]["fallback"]
-    USE_BEDROCK = (PROVIDER == "bedrock")
 
     logger.info(f"╔══════════════════════════════════════════════════════════════════════╗")
     logger.info(f"║  WebArena Parallel Runner                                            ║")
     logger.info(f"╠══════════════════════════════════════════════════════════════════════╣")
-    box_display = BOX_ID if len(BOX_ID) <= 40 else f"{BOX_ID[:37]}..."
+    box_display = BOX_IDS[0] if len(BOX_IDS) == 1 else f"{len(BOX_IDS)} boxes"
+    box_display = box_display if len(box_display) <= 40 else f"{box_display[:37]}..."
     logger.info(f"║  Box ID:      {box_display:<40}           ║")
     logger.info(f"║  Provider:    {PROVIDER:<40}           ║")
     model_display = MODEL if len(MODEL) <= 38 else f"{MODEL[:35]}..."
@@ -388,29 +714,17 @@ Examples:
     logger.info(f"║  Result Dir:  {result_display:<40}           ║")
     logger.info(f"╚══════════════════════════════════════════════════════════════════════╝")
 
-    gbox = GboxSDK()
-    box = gbox.get(BOX_ID)
-
-    logger.info(f"Setting box resolution to {BOX_RESOLUTION_WIDTH}x{BOX_RESOLUTION_HEIGHT}")
-    box.resolution.set(width=BOX_RESOLUTION_WIDTH, height=BOX_RESOLUTION_HEIGHT)
-
-    logger.info("Box ready - will open/close browser per task")
-
-    agent = GboxClaudeAgent(
-        box_id=BOX_ID,
-        action_set_tag=ACTION_SET_TAG,
-        server_name=SERVER_NAME,
-        model=MODEL,
-        gbox_client=gbox.client,
-        use_bedrock=USE_BEDROCK,
-        fallback_model=FALLBACK_MODEL,
-    )
-
-    config_files = []
-    for i in range(TEST_START_IDX, TEST_END_IDX):
-        config_file = f"config_files/{i}.json"
-        if Path(config_file).exists():
-            config_files.append(config_file)
+    # One directory read instead of a stat per task index
+    try:
+        with os.scandir("config_files") as it:
+            existing = {entry.name for entry in it if entry.name.endswith(".json")}
+    except FileNotFoundError:
+        existing = set()
+    config_files = [
+        f"config_files/{i}.json"
+        for i in range(TEST_START_IDX, TEST_END_IDX)
+        if f"{i}.json" in existing
+    ]
 
     if not config_files:
         logger.error(f"No config files found in range {TEST_START_IDX} to {TEST_END_IDX}!")
@@ -422,9 +736,37 @@ Examples:
 
     if len(test_file_list) == 0:
         logger.info("No task left to run")
+        return
+
+    # Tasks are independent, so each box gets a round-robin share and its own
+    # worker process; a box only runs one browser session at a time
+    shards = [
+        (box_id, test_file_list[i::len(BOX_IDS)])
+        for i, box_id in enumerate(BOX_IDS)
+        if test_file_list[i::len(BOX_IDS)]
+    ]
+    scores = []
+    if len(shards) == 1:
+        scores = run_on_box(shards[0][0], shards[0][1], PROVIDER, RESULT_DIR)
     else:
-        logger.info(f"Running {len(test_file_list)} tasks (fresh browser per task)")
-        test(agent, test_file_list, BOX_ID, gbox.client, RESULT_DIR)
+        # Spawned workers don't inherit the parent's event loop or SDK clients
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {
+                executor.submit(run_on_box, box_id, shard, PROVIDER, RESULT_DIR): box_id
+                for box_id, shard in shards
+            }
+            for future in as_completed(futures):
+                try:
+                    scores.extend(future.result())
+                except Exception as e:
+                    logger.error("Box %s failed: %r", futures[future], e)
+
+    # All tasks complete
+    if scores:
+        logger.info(f"Average score: {sum(scores) / len(scores)}")
 
     logger.info("✅ All tasks complete! Box remains alive.")
 
@@ -0,0 +1,84 @@
+"""Shared scaffolding for the manual GBOX task scripts"""
+import time
+import traceback
+
+from gbox_sdk import GboxSDK
+
+GBOX_APP_URL = "https://app.gbox.ai"
+
+_sdk = None
+
+
+def sdk() -> GboxSDK:
+    """Return the process-wide GboxSDK, creating it on first use"""
+    global _sdk
+    if _sdk is None:
+        _sdk = GboxSDK()
+    return _sdk
+
+
+def wait_for_box_running(box_id, timeout=30.0):
+    """Poll the box status with backoff until it is running"""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        status = sdk().client.v1.boxes.retrieve(box_id=box_id).status
+        if status == "running":
+            return
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(
+                f"Box {box_id} not running after {timeout:.0f}s (status: {status})"
+            )
+        time.sleep(delay)
+        delay = min(delay * 1.5, 1.0)
+
+
+def open_task_browser(
+    box_id,
+    title,
+    steps,
+    message=None,
+    footer=None,
+    resolution=(1920, 1080),
+    box=None,
+):
+    """Open a browser with controls in the box and print the task steps.
+
+    message is set off by rules below the steps, and footer follows it.
+
+    Set resolution to None to keep the box's current resolution. Pass box when
+    the caller already holds the box object to skip fetching it again.
+    Returns True if the browser was opened, and prints the error otherwise.
+    """
+    try:
+        if resolution is not None:
+            width, height = resolution
+            print(f"Setting resolution to {width}x{height}...")
+            box = box or sdk().get(box_id)
+            box.resolution.set(width=width, height=height)
+
+        print(f"Opening browser in box {box_id}...")
+        sdk().client.v1.boxes.browser.open(
+            box_id=box_id,
+            show_controls=True
+        )
+        print("✅ Browser opened successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        traceback.print_exc()
+        return False
+
+    print(f"\n{'='*80}")
+    print(title)
+    print(f"{'='*80}")
+    print(steps)
+    if message is not None:
+        print(f"\n{'─'*80}")
+        print(message)
+        print(f"{'─'*80}")
+    if footer is not None:
+        print(footer)
+    print(f"\n📱 Access GBOX at: {GBOX_APP_URL}")
+    print(f"   Box ID: {box_id}")
+    print(f"{'='*80}")
+    return True
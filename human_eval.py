@@ -11,7 +11,6 @@ Usage:
 
 import argparse
 import json
-import subprocess
 import tempfile
 import time
 from pathlib import Path
@@ -19,7 +18,7 @@ from pathlib import Path
 from playwright.sync_api import sync_playwright
 
 from browser_env import create_stop_action, StateInfo, Trajectory
-from browser_env.auto_login import get_site_comb_from_filepath
+from browser_env.auto_login import get_site_comb_from_filepath, renew_comb
 from evaluation_harness import evaluator_router
 
 
@@ -89,10 +88,7 @@ def human_eval(task_id: int):
         cookie_file_name = Path(config['storage_state']).name
         comb = get_site_comb_from_filepath(cookie_file_name)
         temp_dir = tempfile.mkdtemp()
-        subprocess.run(
-            ["python", "browser_env/auto_login.py", "--auth_folder", temp_dir, "--site_list", *comb],
-            check=True
-        )
+        renew_comb(comb, auth_folder=temp_dir)
         config['storage_state'] = f"{temp_dir}/{cookie_file_name}"
 
     # Open browser
@@ -138,7 +134,7 @@ def human_eval(task_id: int):
 
         # Capture final state
         # Refresh page reference to use the active tab (handles new-tab navigation)
-        if context.pages:
+        if context.pages and context.pages[-1] is not page:
             page = context.pages[-1]
             # Recreate CDP session for the active page to keep evaluator happy
             client = page.context.new_cdp_session(page)
@@ -11,26 +11,118 @@ Press Ctrl+C to exit.
 """
 
 import argparse
+import functools
+import io
 import json
 import os
 import re
+import shutil
 import sys
+import threading
 import time
-from collections import defaultdict
+import unicodedata
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
 
+try:
+    # Optional faster JSON parser for task configs
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional, more exact terminal widths (emoji sequences, variation selectors)
+    from wcwidth import wcswidth
+except ImportError:
+    wcswidth = None
+
+try:
+    from watchdog.events import PatternMatchingEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+CONFIG_DIR = Path('config_files')
+
+TASK_ID_RE = re.compile(r'task_(\d+)_')
+
+# Statuses that are final once written to a log
+TERMINAL_STATUSES = ('PASS', 'FAIL')
+
+# Matches either result marker in one pass over the raw bytes
+RESULT_RE = re.compile(rb'\[Result\] \((PASS|FAIL)\)')
+# The [Result] line is written near the end of a task log, so at most this
+# much of the tail is read, however much has been appended
+RESULT_TAIL_BYTES = 8192
+# Bytes re-read before the last offset so a marker split across reads is found
+MARKER_OVERLAP = len(b'[Result] (PASS)') - 1
+
+# Without watchdog the monitor polls every --interval seconds instead
+WATCH_EVENT_TYPES = ('created', 'modified', 'moved', 'deleted')
+# With watchdog, still redraw this often so the "time ago" columns stay current
+IDLE_REFRESH_INTERVAL = 30.0
+# Pause after a change so a burst of log writes is drawn as one refresh
+CHANGE_SETTLE_SECONDS = 0.2
+# Threads reading logs in parallel; each log is analyzed by one thread per refresh
+ANALYSIS_WORKERS = 8
+
+# Characters in the overall progress bar
+BAR_WIDTH = 60
+
+# Sidecar in the log directory that keeps analyses across monitor runs
+ANALYSIS_CACHE_FILE = '.monitor_cache.json'
+# Refreshes between saves of the sidecar while monitoring
+CACHE_SAVE_INTERVAL = 10
+
+# log path -> (st_mtime_ns, st_size, bytes read so far, status, last_modified_time)
+_ANALYSIS_CACHE: dict[Path, tuple[int, int, int, str, datetime]] = {}
+
+
+def preload_task_types(config_dir: Path = CONFIG_DIR) -> dict[int, str]:
+    """
+    Map every task id with a config in config_dir to its task type.
 
-def get_task_type(task_id: int, config_dir: Path = Path('config_files')) -> str:
-    """Get the task type from config file."""
-    config_file = config_dir / f"{task_id}.json"
+    Lists the directory once up front, so refreshes only do dict lookups.
+    """
+    try:
+        with os.scandir(config_dir) as it:
+            config_files = [
+                entry.path for entry in it
+                if entry.name.endswith('.json') and entry.name[:-len('.json')].isdigit()
+            ]
+    except OSError:
+        return {}
 
-    if not config_file.exists():
-        return 'unknown'
+    return {
+        int(os.path.basename(config_file)[:-len('.json')]): read_task_type(config_file)
+        for config_file in config_files
+    }
+
+
+def lookup_task_type(task_types: dict[int, str], task_id: int, config_dir: Path = CONFIG_DIR) -> str:
+    """
+    Get a task's type from the preloaded map, reading configs added since.
+
+    A type found on a cache miss is stored in task_types; 'unknown' is not, so
+    a config that is still being written is read again on the next refresh.
+    """
+    task_type = task_types.get(task_id)
+    if task_type is None:
+        task_type = read_task_type(str(config_dir / f'{task_id}.json'))
+        if task_type != 'unknown':
+            task_types[task_id] = task_type
+    return task_type
 
+
+def read_task_type(config_file: str) -> str:
+    """Get the task type from a task config file."""
     try:
-        with open(config_file) as f:
-            data = json.load(f)
+        with open(config_file, 'rb') as f:
+            raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             sites = data.get('sites', [])
 
             if not sites:
@@ -51,38 +143,205 @@ def get_task_type(task_id: int, config_dir: Path = Path('config_files')) -> str:
         return 'unknown'
 
 
-def analyze_log_file(log_path: Path) -> tuple[str, datetime]:
+def list_log_entries(log_dir: Path) -> list[os.DirEntry]:
+    """List the task_*.log files in log_dir, sorted by name."""
+    with os.scandir(log_dir) as it:
+        entries = [
+            entry for entry in it
+            if entry.name.startswith('task_') and entry.name.endswith('.log') and entry.is_file()
+        ]
+    entries.sort(key=lambda entry: entry.name)
+    return entries
+
+
+def finished_analysis(log_path: Path) -> tuple[str, datetime] | None:
+    """Return the cached (status, last_modified_time) of a log that already has a result."""
+    cached = _ANALYSIS_CACHE.get(log_path)
+    if cached is not None and cached[3] in TERMINAL_STATUSES:
+        return cached[3], cached[4]
+    return None
+
+
+def analyze_log_file(log_path: Path, entry: os.DirEntry | None = None) -> tuple[str, datetime]:
     """
     Analyze a single log file and return its status and last modified time.
 
+    Logs only grow while a task runs, so each refresh reads just the bytes
+    appended since the last one, capped to the log's tail; unchanged logs are
+    not read at all, and logs with a result are never read again. Pass the file's scandir entry
+    to stat through it (cached by the directory scan on Windows).
+
     Returns:
         Tuple of (status, last_modified_time)
     """
-    try:
-        content = log_path.read_text()
-        mtime = datetime.fromtimestamp(log_path.stat().st_mtime)
+    finished = finished_analysis(log_path)
+    if finished is not None:
+        return finished
 
-        if '[Result] (PASS)' in content:
-            return 'PASS', mtime
-        elif '[Result] (FAIL)' in content:
-            return 'FAIL', mtime
-        else:
-            return 'INCOMPLETE', mtime
+    cached = _ANALYSIS_CACHE.get(log_path)
+    try:
+        st = entry.stat() if entry is not None else log_path.stat()
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[3], cached[4]
+
+        # Start over if the log was truncated or replaced
+        offset = cached[2] if cached is not None and cached[2] <= st.st_size else 0
+        with log_path.open('rb') as f:
+            f.seek(max(0, offset - MARKER_OVERLAP, st.st_size - RESULT_TAIL_BYTES))
+            appended = f.read()
+            offset = f.tell()
+        mtime = datetime.fromtimestamp(st.st_mtime)
+
+        match = RESULT_RE.search(appended) if appended else None
+        status = match.group(1).decode() if match else 'INCOMPLETE'
+        _ANALYSIS_CACHE[log_path] = (st.st_mtime_ns, st.st_size, offset, status, mtime)
+        return status, mtime
     except Exception:
         return 'ERROR', datetime.now()
 
 
+def prune_analysis_cache(log_files: list[Path]):
+    """
+    Drop cached analyses for logs that are no longer on disk.
+
+    Keeps the cache bounded by the current log count, and makes sure a
+    deleted log that is later rerun under the same name is read afresh.
+    """
+    stale = _ANALYSIS_CACHE.keys() - set(log_files)
+    for log_path in stale:
+        del _ANALYSIS_CACHE[log_path]
+
+
+def load_analysis_cache(log_dir: Path):
+    """Restore analyses saved by an earlier run for logs unchanged since then."""
+    try:
+        with open(log_dir / ANALYSIS_CACHE_FILE) as f:
+            saved = json.load(f)
+        for name, (mtime_ns, size, offset, status, mtime) in saved.items():
+            log_path = log_dir / name
+            try:
+                st = log_path.stat()
+            except OSError:
+                continue
+            if (st.st_mtime_ns, st.st_size) == (mtime_ns, size):
+                _ANALYSIS_CACHE[log_path] = (
+                    mtime_ns, size, offset, status, datetime.fromtimestamp(mtime)
+                )
+    except (OSError, ValueError, TypeError, AttributeError):
+        # A missing or unreadable sidecar only means starting cold
+        return
+
+
+def save_analysis_cache(log_dir: Path):
+    """Write the analysis cache to the log directory's sidecar file."""
+    saved = {
+        log_path.name: [mtime_ns, size, offset, status, mtime.timestamp()]
+        for log_path, (mtime_ns, size, offset, status, mtime) in _ANALYSIS_CACHE.items()
+    }
+    cache_file = log_dir / ANALYSIS_CACHE_FILE
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(saved, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The sidecar is only a speed-up, so a read-only log dir is fine
+        pass
+
+
+@functools.lru_cache(maxsize=None)
 def extract_task_id(filename: str) -> int:
-    """Extract task ID from log filename."""
-    match = re.match(r'task_(\d+)_', filename)
+    """Extract task ID from log filename (parsed once per name per run)."""
+    match = TASK_ID_RE.match(filename)
     if match:
         return int(match.group(1))
     return -1
 
 
+def start_log_watcher(log_dir: Path, changed: threading.Event):
+    """
+    Set `changed` whenever a task log in log_dir is created, written or removed.
+
+    Returns:
+        The running observer, or None if watchdog is not installed
+    """
+    if Observer is None:
+        return None
+
+    def on_any_event(event):
+        if event.event_type in WATCH_EVENT_TYPES:
+            changed.set()
+
+    handler = PatternMatchingEventHandler(patterns=['task_*.log'], ignore_directories=True)
+    handler.on_any_event = on_any_event
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(handler, str(log_dir), recursive=False)
+    observer.start()
+    return observer
+
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    # Escape sequences instead of spawning `clear` on every refresh
+    sys.stdout.write('\x1b[2J\x1b[H')
+
+
+@functools.lru_cache(maxsize=1024)
+def display_width(line: str) -> int:
+    """Terminal columns a line takes up; wide characters such as emoji count twice."""
+    if wcswidth is not None:
+        width = wcswidth(line)
+        if width >= 0:
+            return width
+    width = 0
+    for char in line:
+        if unicodedata.combining(char) or unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    return width
+
+
+def draw_frame(frame: str, previous: list[str]) -> list[str]:
+    """
+    Draw a frame by rewriting only the lines that differ from the previous one.
+
+    Falls back to clearing the screen when there is no previous frame or the
+    frame is taller or wider than the terminal, where wrapped or scrolled
+    lines would no longer line up with cursor rows.
+
+    Returns:
+        The lines now on screen, to pass back in with the next frame
+    """
+    lines = frame.split('\n')
+    size = shutil.get_terminal_size()
+    if (
+        not previous
+        or len(lines) > size.lines
+        or max(map(display_width, lines)) > size.columns
+    ):
+        clear_screen()
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        return lines
+
+    out = []
+    for row, line in enumerate(lines, 1):
+        if row > len(previous) or line != previous[row - 1]:
+            # Move to the row, write the line and erase what is left of the old one
+            out.append(f'\x1b[{row};1H{line}\x1b[K')
+    # Park the cursor below the frame and erase any rows left from a taller one
+    out.append(f'\x1b[{len(lines)};1H\x1b[J')
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+    return lines
+
+
+@functools.lru_cache(maxsize=256)
+def progress_bar(pass_bar: int, fail_bar: int, incomplete_bar: int) -> str:
+    """Build the progress bar line, reused while the segment widths are unchanged."""
+    rest = BAR_WIDTH - pass_bar - fail_bar - incomplete_bar
+    return f"  [{'█' * pass_bar}{'▓' * fail_bar}{'░' * incomplete_bar}{' ' * rest}]"
 
 
 def format_time_ago(dt: datetime) -> str:
@@ -104,46 +363,85 @@ def monitor_logs(log_dir: Path, refresh_interval: float = 2.0):
 
     Args:
         log_dir: Directory containing log files
-        refresh_interval: Seconds between refreshes
+        refresh_interval: Seconds between refreshes when watchdog is not installed
     """
+    if os.name == 'nt':
+        # Turns on escape sequence handling in the Windows console
+        os.system('')
+
+    changed = threading.Event()
+    observer = start_log_watcher(log_dir, changed)
+
     print(f"🔍 Starting real-time monitor for {log_dir}/")
-    print(f"⏱️  Refreshing every {refresh_interval}s")
+    if observer is not None:
+        print("⏱️  Refreshing when logs change")
+    else:
+        print(f"⏱️  Refreshing every {refresh_interval}s")
     print(f"Press Ctrl+C to exit\n")
     time.sleep(2)
 
+    def wait_for_refresh():
+        """Block until the next frame is due."""
+        if observer is None:
+            time.sleep(refresh_interval)
+        elif changed.wait(IDLE_REFRESH_INTERVAL):
+            time.sleep(CHANGE_SETTLE_SECONDS)
+        changed.clear()
+
     last_completed_count = 0
     last_file_count = 0
+    screen_lines: list[str] = []
+    refresh_count = 0
+    load_analysis_cache(log_dir)
+    task_types = preload_task_types()
+    # Reading logs is I/O bound, so overlap the reads with a thread pool kept
+    # for the whole session
+    pool = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS)
 
     try:
         while True:
-            clear_screen()
-
             # Find all log files
-            log_files = sorted(log_dir.glob('task_*.log'))
+            log_entries = list_log_entries(log_dir)
+            log_files = [Path(entry.path) for entry in log_entries]
+            prune_analysis_cache(log_files)
 
             if not log_files:
+                clear_screen()
+                screen_lines = []
                 print(f"⏳ Waiting for log files in {log_dir}/...")
-                time.sleep(refresh_interval)
+                wait_for_refresh()
                 continue
 
             # Analyze each file
             results = defaultdict(list)
-            task_type_counts = defaultdict(lambda: defaultdict(int))
             recent_completions = []
 
-            for log_file in log_files:
-                status, mtime = analyze_log_file(log_file)
+            # Finished logs come straight from the cache; only new and running
+            # logs are handed to the pool
+            analyses = [finished_analysis(log_file) for log_file in log_files]
+            pending = [i for i, analysis in enumerate(analyses) if analysis is None]
+            pending_analyses = pool.map(
+                analyze_log_file,
+                [log_files[i] for i in pending],
+                [log_entries[i] for i in pending],
+            )
+            for i, analysis in zip(pending, pending_analyses):
+                analyses[i] = analysis
+
+            rows = []
+            for log_file, (status, mtime) in zip(log_files, analyses):
                 task_id = extract_task_id(log_file.name)
-                task_type = get_task_type(task_id)
+                task_type = lookup_task_type(task_types, task_id)
+                rows.append((task_type, status))
                 results[status].append((task_id, task_type, log_file.name, mtime))
 
-                # Track counts by task type
-                task_type_counts[task_type][status] += 1
-
                 # Track recent completions
                 if status in ['PASS', 'FAIL']:
                     recent_completions.append((task_id, task_type, status, mtime))
 
+            # Track counts by task type
+            task_type_counts: Counter[tuple[str, str]] = Counter(rows)
+
             # Sort recent completions by time
             recent_completions.sort(key=lambda x: x[3], reverse=True)
 
@@ -154,106 +452,120 @@ def monitor_logs(log_dir: Path, refresh_interval: float = 2.0):
             incomplete_count = len(results['INCOMPLETE'])
             completed = pass_count + fail_count
 
-            # Print header
-            print("=" * 80)
-            print(f"{'WebArena Real-Time Monitor':^80}")
-            print(f"{'Updated: ' + datetime.now().strftime('%Y-%m-%d %H:%M:%S'):^80}")
-            print("=" * 80)
-
-            # Overall stats
-            print(f"\n{'OVERALL PROGRESS':^80}")
-            print("─" * 80)
-
-            # Progress bar
-            if total > 0:
-                pass_pct = pass_count / total
-                fail_pct = fail_count / total
-                incomplete_pct = incomplete_count / total
-
-                bar_width = 60
-                pass_bar = int(pass_pct * bar_width)
-                fail_bar = int(fail_pct * bar_width)
-                incomplete_bar = int(incomplete_pct * bar_width)
-
-                print(f"  [{'█' * pass_bar}{'▓' * fail_bar}{'░' * incomplete_bar}{' ' * (bar_width - pass_bar - fail_bar - incomplete_bar)}]")
-                print(f"  {'✅ Pass':15} {'❌ Fail':15} {'⏳ Running':15} {'📊 Total':15}")
-                print(f"  {pass_count:3d} ({pass_pct*100:5.1f}%)    {fail_count:3d} ({fail_pct*100:5.1f}%)    {incomplete_count:3d} ({incomplete_pct*100:5.1f}%)    {total:3d}")
-
-            if completed > 0:
-                success_rate = pass_count / completed * 100
-                print(f"\n  🎯 Success Rate (completed): {success_rate:.1f}% ({pass_count}/{completed})")
-
-            # Show new completions indicator
-            if completed != last_completed_count:
-                new_completions = completed - last_completed_count
-                if new_completions > 0:
-                    print(f"  🆕 {new_completions} new completion(s) since last refresh")
-                last_completed_count = completed
-
-            if len(log_files) != last_file_count:
-                new_files = len(log_files) - last_file_count
-                if new_files > 0:
-                    print(f"  📝 {new_files} new task(s) started")
-                last_file_count = len(log_files)
-
-            # Breakdown by task type
-            print(f"\n{'BREAKDOWN BY TASK TYPE':^80}")
-            print("─" * 80)
-            print(f"  {'Type':<15} {'Total':>6} {'Pass':>6} {'Fail':>6} {'Running':>8} {'Success':>8}")
-            print("  " + "─" * 70)
-
-            for task_type in sorted(task_type_counts.keys()):
-                counts = task_type_counts[task_type]
-                total_type = sum(counts.values())
-                passed = counts.get('PASS', 0)
-                failed = counts.get('FAIL', 0)
-                incomplete = counts.get('INCOMPLETE', 0)
-                completed_type = passed + failed
-
-                success = (passed / completed_type * 100) if completed_type > 0 else 0
-
-                # Emoji based on performance
-                if success >= 70:
-                    emoji = "🌟"
-                elif success >= 50:
-                    emoji = "✅"
-                elif success >= 30:
-                    emoji = "⚠️"
-                else:
-                    emoji = "❌"
-
-                print(f"  {emoji} {task_type:<13} {total_type:>6} {passed:>6} {failed:>6} {incomplete:>8} {success:>7.1f}%")
-
-            # Recent completions
-            print(f"\n{'RECENT COMPLETIONS (Last 10)':^80}")
-            print("─" * 80)
-
-            if recent_completions:
-                for i, (task_id, task_type, status, mtime) in enumerate(recent_completions[:10]):
-                    status_emoji = "✅" if status == "PASS" else "❌"
-                    time_str = format_time_ago(mtime)
-                    print(f"  {status_emoji} Task {task_id:3d} [{task_type:15s}] - {time_str:>8}")
-            else:
-                print("  No completed tasks yet...")
-
-            # Currently running tasks
-            running_tasks = [(tid, ttype) for tid, ttype, _, _ in results['INCOMPLETE']]
-            if running_tasks:
-                print(f"\n{'CURRENTLY RUNNING (' + str(len(running_tasks)) + ')':^80}")
+            # Build the frame in memory and write only the changed lines in one
+            # go, so the terminal gets a single small write per refresh
+            with redirect_stdout(io.StringIO()) as frame:
+                # Print header
+                print("=" * 80)
+                print(f"{'WebArena Real-Time Monitor':^80}")
+                print(f"{'Updated: ' + datetime.now().strftime('%Y-%m-%d %H:%M:%S'):^80}")
+                print("=" * 80)
+
+                # Overall stats
+                print(f"\n{'OVERALL PROGRESS':^80}")
+                print("─" * 80)
+
+                # Progress bar
+                if total > 0:
+                    pass_pct = pass_count / total
+                    fail_pct = fail_count / total
+                    incomplete_pct = incomplete_count / total
+
+                    pass_bar = pass_count * BAR_WIDTH // total
+                    fail_bar = fail_count * BAR_WIDTH // total
+                    incomplete_bar = incomplete_count * BAR_WIDTH // total
+
+                    print(progress_bar(pass_bar, fail_bar, incomplete_bar))
+                    print(f"  {'✅ Pass':15} {'❌ Fail':15} {'⏳ Running':15} {'📊 Total':15}")
+                    print(f"  {pass_count:3d} ({pass_pct*100:5.1f}%)    {fail_count:3d} ({fail_pct*100:5.1f}%)    {incomplete_count:3d} ({incomplete_pct*100:5.1f}%)    {total:3d}")
+
+                if completed > 0:
+                    success_rate = pass_count / completed * 100
+                    print(f"\n  🎯 Success Rate (completed): {success_rate:.1f}% ({pass_count}/{completed})")
+
+                # Show new completions indicator
+                if completed != last_completed_count:
+                    new_completions = completed - last_completed_count
+                    if new_completions > 0:
+                        print(f"  🆕 {new_completions} new completion(s) since last refresh")
+                    last_completed_count = completed
+
+                if len(log_files) != last_file_count:
+                    new_files = len(log_files) - last_file_count
+                    if new_files > 0:
+                        print(f"  📝 {new_files} new task(s) started")
+                    last_file_count = len(log_files)
+
+                # Breakdown by task type
+                print(f"\n{'BREAKDOWN BY TASK TYPE':^80}")
+                print("─" * 80)
+                print(f"  {'Type':<15} {'Total':>6} {'Pass':>6} {'Fail':>6} {'Running':>8} {'Success':>8}")
+                print("  " + "─" * 70)
+
+                for task_type in sorted({task_type for task_type, _ in task_type_counts}):
+                    passed = task_type_counts[(task_type, 'PASS')]
+                    failed = task_type_counts[(task_type, 'FAIL')]
+                    incomplete = task_type_counts[(task_type, 'INCOMPLETE')]
+                    total_type = passed + failed + incomplete + task_type_counts[(task_type, 'ERROR')]
+                    completed_type = passed + failed
+
+                    success = (passed / completed_type * 100) if completed_type > 0 else 0
+
+                    # Emoji based on performance
+                    if success >= 70:
+                        emoji = "🌟"
+                    elif success >= 50:
+                        emoji = "✅"
+                    elif success >= 30:
+                        emoji = "⚠️"
+                    else:
+                        emoji = "❌"
+
+                    print(f"  {emoji} {task_type:<13} {total_type:>6} {passed:>6} {failed:>6} {incomplete:>8} {success:>7.1f}%")
+
+                # Recent completions
+                print(f"\n{'RECENT COMPLETIONS (Last 10)':^80}")
                 print("─" * 80)
-                # Show up to 10 running tasks
-                for task_id, task_type in sorted(running_tasks[:10]):
-                    print(f"  ⏳ Task {task_id:3d} [{task_type:15s}]")
-                if len(running_tasks) > 10:
-                    print(f"  ... and {len(running_tasks) - 10} more")
 
-            print("\n" + "=" * 80)
-            print(f"  Refreshing in {refresh_interval}s... (Press Ctrl+C to exit)")
-            print("=" * 80)
+                if recent_completions:
+                    for i, (task_id, task_type, status, mtime) in enumerate(recent_completions[:10]):
+                        status_emoji = "✅" if status == "PASS" else "❌"
+                        time_str = format_time_ago(mtime)
+                        print(f"  {status_emoji} Task {task_id:3d} [{task_type:15s}] - {time_str:>8}")
+                else:
+                    print("  No completed tasks yet...")
+
+                # Currently running tasks
+                running_tasks = [(tid, ttype) for tid, ttype, _, _ in results['INCOMPLETE']]
+                if running_tasks:
+                    print(f"\n{'CURRENTLY RUNNING (' + str(len(running_tasks)) + ')':^80}")
+                    print("─" * 80)
+                    # Show up to 10 running tasks
+                    for task_id, task_type in sorted(running_tasks[:10]):
+                        print(f"  ⏳ Task {task_id:3d} [{task_type:15s}]")
+                    if len(running_tasks) > 10:
+                        print(f"  ... and {len(running_tasks) - 10} more")
+
+                print("\n" + "=" * 80)
+                if observer is not None:
+                    print("  Refreshing on log changes... (Press Ctrl+C to exit)")
+                else:
+                    print(f"  Refreshing in {refresh_interval}s... (Press Ctrl+C to exit)")
+                print("=" * 80)
 
-            time.sleep(refresh_interval)
+            screen_lines = draw_frame(frame.getvalue(), screen_lines)
+
+            refresh_count += 1
+            if refresh_count % CACHE_SAVE_INTERVAL == 0:
+                save_analysis_cache(log_dir)
+
+            wait_for_refresh()
 
     except KeyboardInterrupt:
+        pool.shutdown(cancel_futures=True)
+        if observer is not None:
+            observer.stop()
+        save_analysis_cache(log_dir)
         clear_screen()
         print("\n👋 Monitoring stopped. Final stats:\n")
 
@@ -284,18 +596,25 @@ def print_task_summary(log_dir: Path):
     Args:
         log_dir: Directory containing log files
     """
-    log_files = sorted(log_dir.glob('task_*.log'))
+    log_entries = list_log_entries(log_dir)
+    log_files = [Path(entry.path) for entry in log_entries]
 
     if not log_files:
         print("No log files found.")
         return
 
+    load_analysis_cache(log_dir)
+    task_types = preload_task_types()
+
     results = {'FAIL': [], 'INCOMPLETE': [], 'PASS': []}
 
-    for log_file in log_files:
-        status, _ = analyze_log_file(log_file)
+    with ThreadPoolExecutor(max_workers=min(32, len(log_files))) as executor:
+        analyses = list(executor.map(analyze_log_file, log_files, log_entries))
+    save_analysis_cache(log_dir)
+
+    for log_file, (status, _) in zip(log_files, analyses):
         task_id = extract_task_id(log_file.name)
-        task_type = get_task_type(task_id)
+        task_type = lookup_task_type(task_types, task_id)
 
         if status == 'PASS':
             results['PASS'].append((task_id, task_type))
@@ -343,7 +662,7 @@ def main():
         '--interval',
         type=float,
         default=2.0,
-        help='Refresh interval in seconds (default: 2.0)'
+        help='Refresh interval in seconds when watchdog is not installed (default: 2.0)'
     )
     parser.add_argument(
         '--summary',
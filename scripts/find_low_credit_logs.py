@@ -10,8 +10,12 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 
 def parse_args() -> argparse.Namespace:
@@ -43,31 +47,50 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def scan_logs(root: Path, needle: str) -> list[Path]:
-    hits: list[Path] = []
+def _contains(path: Path, needle: bytes) -> bool:
+    with path.open("rb") as handle:
+        # mmap cannot map an empty file, and an empty file cannot match
+        if os.fstat(handle.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # find stops at the first occurrence, so a match near the top is cheap
+            return mm.find(needle) != -1
+
+
+def _log_matches(path: Path, needle: bytes) -> bool:
+    try:
+        return _contains(path, needle)
+    except OSError as exc:
+        print(f"⚠️  Skipping {path}: {exc}", file=sys.stderr)
+        return False
+
+
+def scan_logs(root: Path, needle: str) -> Iterator[Path]:
+    """Yield matching logs in sorted order as soon as each one is scanned."""
     if not root.exists():
-        return hits
+        return
+
+    paths = sorted(root.rglob("*.log"))
+    if not paths:
+        return
 
-    for path in sorted(root.rglob("*.log")):
-        try:
-            with path.open("r", encoding="utf-8", errors="ignore") as handle:
-                if any(needle in line for line in handle):
-                    hits.append(path)
-        except OSError as exc:
-            print(f"⚠️  Skipping {path}: {exc}", file=sys.stderr)
-    return hits
+    # Search the raw bytes so logs are neither split into lines nor decoded
+    needle_bytes = needle.encode("utf-8")
+    # Scanning is I/O bound, so overlap the reads with a thread pool
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        matched = executor.map(lambda path: _log_matches(path, needle_bytes), paths)
+        for path, hit in zip(paths, matched):
+            if hit:
+                yield path
 
 
 def main() -> int:
     args = parse_args()
-    matches = scan_logs(args.root, args.pattern)
 
-    if not matches:
-        print("No log files contain the pattern.")
-        return 0
-
-    print(f"Found {len(matches)} log file(s) containing the pattern:\n")
-    for path in matches:
+    # Report (and delete) each match as it is found rather than after the whole scan
+    match_count = 0
+    for path in scan_logs(args.root, args.pattern):
+        match_count += 1
         task_id = None
         name_parts = path.stem.split("_")
         if len(name_parts) >= 2 and name_parts[0] == "task":
@@ -84,13 +107,15 @@ def main() -> int:
                 except OSError as exc:
                     print(f"  ⚠️ failed to remove log file: {exc}", file=sys.stderr)
 
+                # Unlink directly; a missing render is not an error
                 render_path = args.renders_dir / f"render_{task_id}.html"
-                if render_path.exists():
-                    try:
-                        render_path.unlink()
-                        print(f"  ␡ removed render file {render_path}")
-                    except OSError as exc:
-                        print(f"  ⚠️ failed to remove render file {render_path}: {exc}", file=sys.stderr)
+                try:
+                    render_path.unlink()
+                    print(f"  ␡ removed render file {render_path}")
+                except FileNotFoundError:
+                    pass
+                except OSError as exc:
+                    print(f"  ⚠️ failed to remove render file {render_path}: {exc}", file=sys.stderr)
         else:
             print(path)
             if args.delete:
@@ -99,6 +124,11 @@ def main() -> int:
                     print("  ␡ removed log file (no task id)")
                 except OSError as exc:
                     print(f"  ⚠️ failed to remove log file: {exc}", file=sys.stderr)
+
+    if not match_count:
+        print("No log files contain the pattern.")
+    else:
+        print(f"\nFound {match_count} log file(s) containing the pattern.")
     return 0
 
 
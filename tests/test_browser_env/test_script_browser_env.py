@@ -16,6 +16,7 @@ from browser_env import (
     create_focus_and_click_action,
     create_goto_url_action,
     create_keyboard_type_action,
+    create_none_action,
     create_playwright_action,
     create_scroll_action,
 )
@@ -251,3 +252,26 @@ def test_accessibility_tree_observation_update(
         )
     )
     assert "UNIQUE_NAME" in obs["text"]
+
+
+def test_observation_not_reused_across_documents(
+    accessibility_tree_current_viewport_script_browser_env: ScriptBrowserEnv,
+) -> None:
+    env = accessibility_tree_current_viewport_script_browser_env
+    env.reset()
+    url = "https://russmaxdesign.github.io/exercise/"
+    env.step(create_playwright_action(f"page.goto('{url}')"))
+    obs, *_ = env.step(
+        create_playwright_action(
+            'page.get_by_label("Full name").fill("UNIQUE_NAME")'
+        )
+    )
+    assert "UNIQUE_NAME" in obs["text"]
+    obs, *_ = env.step(create_none_action())
+    assert "UNIQUE_NAME" in obs["text"]
+
+    # a new document at the same URL must not reuse the filled-in observation
+    obs, *_ = env.step(create_playwright_action(f"page.goto('{url}')"))
+    assert "UNIQUE_NAME" not in obs["text"]
+    obs, *_ = env.step(create_none_action())
+    assert "UNIQUE_NAME" not in obs["text"]
@@ -0,0 +1,117 @@
+import random
+from typing import Any
+
+import pytest
+
+from browser_env import (
+    ActionTypes,
+    create_click_action,
+    create_none_action,
+    create_scroll_action,
+    create_type_action,
+)
+from browser_env.actions import is_equivalent
+
+pytest.importorskip("gbox_sdk")
+from gbox_run import ActionSlots, early_stop  # noqa: E402
+
+THRESHOLDS = {"parsing_failure": 3, "repeating_action": 3}
+MAX_STEPS = 30
+
+
+def reference_early_stop(
+    trajectory: list[Any], max_steps: int, thresholds: dict[str, int]
+) -> tuple[bool, str]:
+    """early_stop as it was before the incremental ActionSlots rewrite"""
+    num_steps = (len(trajectory) - 1) / 2
+    if num_steps >= max_steps:
+        return True, f"Reach max steps {max_steps}"
+
+    k = thresholds["parsing_failure"]
+    last_k_actions = trajectory[1::2][-k:]
+    if len(last_k_actions) >= k:
+        if all(
+            [
+                action["action_type"] == ActionTypes.NONE
+                for action in last_k_actions
+            ]
+        ):
+            return True, f"Failed to parse actions for {k} times"
+
+    k = thresholds["repeating_action"]
+    last_k_actions = trajectory[1::2][-k:]
+    action_seq = trajectory[1::2]
+
+    if len(action_seq) == 0:
+        return False, ""
+
+    last_action = action_seq[-1]
+
+    if last_action["action_type"] != ActionTypes.TYPE:
+        if len(last_k_actions) >= k:
+            if all(
+                [is_equivalent(action, last_action) for action in last_k_actions]
+            ):
+                return True, f"Same action for {k} times"
+    else:
+        if (
+            sum([is_equivalent(action, last_action) for action in action_seq])
+            >= k
+        ):
+            return True, f"Same typing action for {k} times"
+
+    return False, ""
+
+
+def outcome(func: Any, *args: Any) -> Any:
+    try:
+        return func(*args)
+    except Exception as e:
+        return type(e)
+
+
+def random_action(rng: random.Random) -> Any:
+    match rng.randrange(4):
+        case 0:
+            return create_none_action()
+        case 1:
+            return create_click_action(element_id=rng.choice("12"))
+        case 2:
+            return create_type_action(text=rng.choice("ab"), element_id=rng.choice("12"))
+        case _:
+            return create_scroll_action(rng.choice(["up", "down"]))
+
+
+def run_loop(actions: list[Any]) -> list[tuple[Any, Any]]:
+    """Drive both versions the way gbox_run.run_agent_loop builds the
+    trajectory: NONE actions add no state, every other action adds one."""
+    trajectory: list[Any] = [{"observation": {}, "info": {}}]
+    slots = ActionSlots(max(THRESHOLDS.values()))
+    outcomes = []
+    for action in actions:
+        expected = outcome(reference_early_stop, trajectory, MAX_STEPS, THRESHOLDS)
+        actual = outcome(early_stop, trajectory, MAX_STEPS, THRESHOLDS, slots)
+        outcomes.append((expected, actual))
+        if expected != (False, ""):
+            break
+        trajectory.append(action)
+        if action["action_type"] != ActionTypes.NONE:
+            trajectory.append({"observation": {}, "info": {}})
+    return outcomes
+
+
+def test_early_stop_counts_none_actions_like_the_trajectory_slice() -> None:
+    # only every other NONE lands on an odd trajectory index, so the parsing
+    # failure rule fires on the fifth NONE in a row, not the third
+    outcomes = run_loop([create_none_action() for _ in range(10)])
+    assert all(expected == actual for expected, actual in outcomes)
+    assert len(outcomes) == 6
+    assert outcomes[-1][1] == (True, "Failed to parse actions for 3 times")
+
+
+def test_early_stop_matches_reference_on_random_trajectories() -> None:
+    rng = random.Random(0)
+    for _ in range(500):
+        actions = [random_action(rng) for _ in range(rng.randrange(1, 40))]
+        for expected, actual in run_loop(actions):
+            assert expected == actual